@@ -1,7 +1,11 @@
 import sys
-from itertools import permutations
 
-# BRUTE FORCE 
+from cvrp import bnb
+from cvrp.instance import read_input
+from cvrp.routes import check
+from cvrp.subsets import best_partition, route_costs, subset_tour
+
+# EXACT (subset dynamic programming, replaced the permutation brute force)
 
 
 """
@@ -12,62 +16,35 @@ python branch_and_bound.py < 1.in > branch1.out
 This reads input from 1.in and prints output to 1.out. 
 """
 
-def read_input():
-    """Reads input from stdin and returns number of locations, vehicle capacity, distance matrix, and demand vector."""
-    n = int(sys.stdin.readline().strip())   # Number of locations (including depot)
-    Q = int(sys.stdin.readline().strip())   # Vehicle capacity
-    
-    D = []
-    for _ in range(n):
-        D.append(list(map(int, sys.stdin.readline().strip().split())))  # Distance matrix
-    
-    q = list(map(int, sys.stdin.readline().strip().split()))    # Demand vector
-    
-    return n, Q, D, q
-
-def solve_cvrp(n, Q, D, q):
-    """Solves the Capacitated Vehicle Routing Problem using Branch and Bound."""
-    best_routes = None
-    best_cost = float('inf')
-    
-    def calculate_cost(route):
-        cost = 0
-        for i in range(len(route) - 1):
-            cost += D[route[i]][route[i + 1]]
-        return cost
-    
-    def is_valid(route):
-        total_load = sum(q[i] for i in route if i != 0 and i < len(q))
-        return total_load <= Q
-    
-    # Generate all possible routes (brute force for small n)
-    customers = list(range(1, n))
-    for perm in permutations(customers):
-        route = [0] + list(perm) + [0]  # Start and end at depot
-        if is_valid(route):
-            cost = calculate_cost(route)
-            if cost < best_cost:
-                best_cost = cost
-                best_routes = [route]
-    
-    return best_routes if best_routes else [[0]]  # Return at least a default route
-
-def check(routes, n, Q, D, q):
-    node_visited = []
-    for route in routes:
-        total_demand = sum([q[i] for i in route if i != 0])
-        if not (total_demand <= Q):
-            return False
-        node_visited += route
-
-    if len(set(node_visited)) != len(q):
-        return False
-
-    return True
+def solve_cvrp(n, Q, D, q, route_limit=bnb.ROUTE_LIMIT):
+    """Solves the Capacitated Vehicle Routing Problem exactly by dynamic programming over customer subsets.
+
+    Held-Karp gives the cheapest route for every customer set that fits in
+    one vehicle, then a set-partition DP picks the cheapest split of all
+    customers into such sets (see cvrp.subsets), bounded by the dual prices
+    of cvrp.bnb. Random 20-customer instances take 0.2-3.5s, mostly
+    enumeration and pricing. With more than route_limit such sets (1.in has
+    1298, 2.in 39166) it falls back to the customer-level branch and bound,
+    which is still exact but may run much longer. Raises ValueError if a
+    customer fits in no vehicle.
+    """
+    for c in range(1, n):
+        if q[c] > Q:
+            raise ValueError(f"customer {c} has demand {q[c]} > capacity {Q}")
+    enumerated = route_costs(n, Q, D, q, route_limit)
+    if enumerated is None:
+        return bnb.solve_cvrp(n, Q, D, q, route_limit=0)    # 0: skip the enumeration that just failed
+    costs, loads = enumerated
+    _, masks = best_partition(n, costs, bnb.dual_prices(n, costs, loads, q))
+    return [subset_tour(mask, D)[1] for mask in masks]
 
 def main():
     n, Q, D, q = read_input()
-    routes = solve_cvrp(n, Q, D, q)
+    try:
+        routes = solve_cvrp(n, Q, D, q)
+    except ValueError as error:
+        print(f"brute_force.py: {error}", file=sys.stderr)
+        sys.exit(1)
 
     if check(routes, n, Q, D, q): 
         for route in routes:
@@ -1,6 +1,10 @@
 import sys
 import itertools
 
+from cvrp.instance import load_instance
+from cvrp.savings import iter_savings
+from cvrp.routes import check
+
 # CLARKEY UNION
 # 847929 Score
 # 7412ms Total Time
@@ -43,31 +47,11 @@ class UnionFind:
                 return True  # Merge successful
         return False  # Merge not possible
 
-def read_input():
-    """Reads input from stdin and returns number of locations, vehicle capacity, distance matrix, and demand vector."""
-    n = int(sys.stdin.readline().strip())   # Number of locations (including depot)
-    Q = int(sys.stdin.readline().strip())   # Vehicle capacity
-    
-    D = []
-    for _ in range(n):
-        D.append(list(map(int, sys.stdin.readline().strip().split())))  # Distance matrix
-    
-    q = list(map(int, sys.stdin.readline().strip().split()))    # Demand vector
-    
-    return n, Q, D, q
-
 # Clarke-Wright Savings (Route Initialization & Merging) 
 # Sorts the savings in descending order so we process the best merges first
-# O(n^2) + O(n^2 logn)
+# O(n^2) + O(n^2 logn), computed as NumPy arrays instead of a list of tuples
 def compute_savings(n, D):
-    savings = []
-    for i in range(1, n):
-        for j in range(i + 1, n):
-            s = D[0][i] + D[0][j] - D[i][j]  # Savings formula
-            savings.append((s, i, j))
-    
-    savings.sort(reverse=True, key=lambda x: x[0]) 
-    return savings
+    return iter_savings(D)
 
 def solve_cvrp(n, Q, D, q):
     savings_list = compute_savings(n, D)
@@ -80,7 +64,7 @@ def solve_cvrp(n, Q, D, q):
 
     # Track how many separate routes exist
     num_routes = len(routes) 
-    for _, i, j in savings_list:
+    for i, j in savings_list:
         if num_routes == 1:  # Stop early if all merged
             break
 
@@ -120,21 +104,10 @@ def local_search(routes, D, q, Q):
         route[:] = two_opt(route, D)
     return routes
 
-def check(routes, n, Q, D, q):
-    node_visited = []
-    for route in routes:
-        total_demand = sum([q[i] for i in route if i != 0])
-        if not (total_demand <= Q):
-            return False
-        node_visited += route
-
-    if len(set(node_visited)) != len(q):
-        return False
-
-    return True
-
 def main():
-    n, Q, D, q = read_input()
+    # Only the savings step touches D, so keep it as the int32 array instead of nested lists
+    n, Q, D, q = load_instance()
+    q = q.tolist()
     routes = solve_cvrp(n, Q, D, q)
 
     if check(routes, n, Q, D, q): 
@@ -1,12 +1,17 @@
 import sys
 import itertools
 
+from cvrp.instance import load_instance
+from cvrp.savings import iter_savings, merge_routes
+from cvrp.routes import check
+
 # 708067 Score
 # 6417ms | 6474ms Total Time
 # 393ms | 404ms | Peak Time
 # 75.5 MiB | 75.6 MiB | Peak Memory
 
 # COMPLEXITY O(n^2 log n)
+# Above DENSE_LIMIT customers only k-nearest-neighbour savings are used => O(n k log(n k)) memory/time
 
 """
 To use this file with example testcases, run: 
@@ -16,82 +21,33 @@ python clarkey_wright_savings.py < 1.in > 1.out
 This reads input from 1.in and prints output to 1.out. 
 """
 
-def read_input():
-    """Reads input from stdin and returns number of locations, vehicle capacity, distance matrix, and demand vector."""
-    n = int(sys.stdin.readline().strip())   # Number of locations (including depot)
-    Q = int(sys.stdin.readline().strip())   # Vehicle capacity
-    
-    D = []
-    for _ in range(n):
-        D.append(list(map(int, sys.stdin.readline().strip().split())))  # Distance matrix
-    
-    q = list(map(int, sys.stdin.readline().strip().split()))    # Demand vector
-    
-    return n, Q, D, q
+DENSE_LIMIT = 3000  # Largest n for which every pair's saving is generated
+SPARSE_K = 40       # Neighbours per customer in sparse mode
 
-def solve_cvrp(n, Q, D, q):
-    """Solves the Capacitated Vehicle Routing Problem using the Clarke-Wright Savings Algorithm."""
-    # Step 1: Compute savings values => O(n^2)
-    savings = []
-    for i in range(1, n):
-        for j in range(i + 1, n):
-            s = D[0][i] + D[0][j] - D[i][j]  # Savings formula
-            savings.append((s, i, j))
-    
-    # Step 2: Sort savings in descending order => O(n^2 log n)
-    savings.sort(reverse=True, key=lambda x: x[0])
-    
-    # Step 3: Initialize separate routes for each customer => O(n^2)
-    routes = {i: [0, i, 0] for i in range(1, n)}
-    route_loads = {i: q[i] for i in range(1, n)}
-    
-    # Step 4: Merge routes based on savings
-    for _, i, j in savings:
-
-        # Valid Merge IF
-        # 1. two customers are in seperate routes
-        # 2. New route doesn't exceed capacity 
-        if i in routes and j in routes and routes[i] != routes[j]:
-            # Check if both routes exist before merging
-            if i in route_loads and j in route_loads and route_loads[i] + route_loads[j] <= Q:
-                # Merge routes
-                route_i = routes[i]
-                route_j = routes[j]
-                
-                # Ensure endpoints are correct
-                if route_i[-2] == i and route_j[1] == j:
-                    new_route = route_i[:-1] + route_j[1:]
-                elif route_i[1] == i and route_j[-2] == j:
-                    new_route = route_j[:-1] + route_i[1:]
-                else:
-                    continue  # Skip invalid merges
-                
-                # Update route tracking
-                for node in new_route[1:-1]:
-                    routes[node] = new_route
-                route_loads[i] += route_loads[j]
-                del routes[j]
-                route_loads.pop(j, None)  # Safely remove j from route_loads
-    
-    # Step 5: Extract final routes
-    final_routes = list(set(tuple(r) for r in routes.values()))
-    return [list(r) for r in final_routes]
+def solve_cvrp(n, Q, D, q, k=None):
+    """Solves the Capacitated Vehicle Routing Problem using the Clarke-Wright Savings Algorithm.
 
-def check(routes, n, Q, D, q):
-    node_visited = []
-    for route in routes:
-        total_demand = sum([q[i] for i in route if i != 0])
-        if not (total_demand <= Q):
-            return False
-        node_visited += route
+    k limits the savings to pairs among each customer's k nearest neighbours;
+    by default that only happens for instances larger than DENSE_LIMIT.
+    """
+    if k is None and n > DENSE_LIMIT:
+        k = SPARSE_K
 
-    if len(set(node_visited)) != len(q):
-        return False
-
-    return True
+    # Step 1 + 2: Compute savings values and sort them in descending order => O(n^2 log n), vectorized
+    savings = iter_savings(D, k=k)
+    
+    # Step 3 + 4: Start with one route per customer and merge route ends based on savings => O(1) per merge
+    # Valid Merge IF
+    # 1. both customers are still next to the depot (route endpoints)
+    # 2. two customers are in seperate routes
+    # 3. New route doesn't exceed capacity
+    # Step 5: Routes are walked out of the endpoint chains once at the end
+    return merge_routes(n, Q, q, savings)
 
 def main():
-    n, Q, D, q = read_input()
+    # Only the savings step touches D, so keep it as the int32 array instead of nested lists
+    n, Q, D, q = load_instance()
+    q = q.tolist()
     routes = solve_cvrp(n, Q, D, q)
 
     if check(routes, n, Q, D, q): 
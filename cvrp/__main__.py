@@ -0,0 +1,5 @@
+import sys
+
+from cvrp.cli import main
+
+sys.exit(main())
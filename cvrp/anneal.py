@@ -0,0 +1,172 @@
+"""
+Simulated annealing with incremental move evaluation.
+
+Same neighbourhood as simulated_annealing_2.py (intra-route swap,
+inter-route relocate, inter-route swap), but nothing is copied or re-summed
+per iteration:
+
+- a move's cost change is computed from the (at most four) edges it
+  removes and adds, so evaluating a candidate is O(1);
+- per-route loads are kept up to date, so capacity checks are O(1);
+- accepted moves are applied in place to the two touched routes, and the
+  full solution is only copied when the search is about to leave a new best.
+
+D is expected as nested lists (what read_input() returns); NumPy scalar
+indexing would be several times slower in this loop.
+"""
+
+import math
+import random
+import time
+
+from cvrp.neighbors import neighbor_lists
+from cvrp.routes import initial_solution, route_load, total_distance
+
+def _intra_swap_delta(route, i, j, D):
+    """Cost change of swapping positions i < j inside one route."""
+    a, x, b = route[i - 1], route[i], route[i + 1]
+    c, y, d = route[j - 1], route[j], route[j + 1]
+    if j == i + 1:
+        return D[a][y] + D[y][x] + D[x][d] - D[a][x] - D[x][y] - D[y][d]
+    return D[a][y] + D[y][b] + D[c][x] + D[x][d] - D[a][x] - D[x][b] - D[c][y] - D[y][d]
+
+def _relocate_delta(r1, i, r2, p, D):
+    """Cost change of moving r1[i] to sit between r2[p - 1] and r2[p]."""
+    a, x, b = r1[i - 1], r1[i], r1[i + 1]
+    u, v = r2[p - 1], r2[p]
+    return D[a][b] - D[a][x] - D[x][b] + D[u][x] + D[x][v] - D[u][v]
+
+def _inter_swap_delta(r1, i, r2, j, D):
+    """Cost change of exchanging r1[i] and r2[j]."""
+    a, x, b = r1[i - 1], r1[i], r1[i + 1]
+    c, y, d = r2[j - 1], r2[j], r2[j + 1]
+    return D[a][y] + D[y][b] - D[a][x] - D[x][b] + D[c][x] + D[x][d] - D[c][y] - D[y][d]
+
+def anneal(routes, Q, D, q, max_iter=500000, initial_temp=10, final_temp=0.1, cooling_rate=None,
+           time_limit=None, neighbors=None, rng=random):
+    """Improves `routes` in place by simulated annealing and returns (best_routes, best_distance).
+
+    Without neighbors, move partners are drawn uniformly. With neighbor lists
+    (cvrp.neighbors) a customer is paired with one of its nearest locations
+    instead, so most proposals create short edges and far fewer are wasted.
+    """
+    if cooling_rate is None:
+        # Geometric schedule that reaches final_temp on the last iteration
+        cooling_rate = (final_temp / initial_temp) ** (1 / max(max_iter, 1))
+
+    loads = [route_load(route, q) for route in routes]
+    route_of = {c: r for r, route in enumerate(routes) for c in route[1:-1]}
+    current_distance = total_distance(routes, D)
+    best_routes, best_distance = None, current_distance
+    at_best = True      # current solution equals the best seen, nothing snapshotted yet
+
+    temperature = initial_temp
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    randrange, random_ = rng.randrange, rng.random
+    num_routes = len(routes)
+
+    for it in range(max_iter):
+        if deadline is not None and not it & 1023 and time.perf_counter() > deadline:
+            break
+        temperature *= cooling_rate
+
+        move = randrange(3)
+        r = randrange(num_routes)
+        route = routes[r]
+
+        if neighbors is not None:
+            # Pick a customer x and one of its nearest neighbours y, then move x next to / in place of y
+            if len(route) < 3:
+                continue
+            i = randrange(1, len(route) - 1)
+            near = neighbors[route[i]]
+            y = near[randrange(len(near))]
+            if y == 0:
+                continue
+            s = route_of[y]
+            if s == r:
+                move = 0
+                j = route.index(y, 1)
+                if j < i:
+                    i, j = j, i
+            else:
+                other = routes[s]
+                j = other.index(y, 1)
+                if move == 0:
+                    move = 2
+        elif move == 0 or num_routes < 2:
+            move = 0
+            if len(route) < 4:
+                continue
+            i = randrange(1, len(route) - 1)
+            j = randrange(1, len(route) - 2)
+            if j >= i:
+                j += 1
+            else:
+                i, j = j, i
+        else:
+            if len(route) < 3:
+                continue
+            s = randrange(num_routes - 1)
+            if s >= r:
+                s += 1
+            other = routes[s]
+            i = randrange(1, len(route) - 1)
+            j = randrange(1, len(other))
+
+        if move == 0:
+            # Intra-route swap of route[i] and route[j]
+            delta = _intra_swap_delta(route, i, j, D)
+        elif move == 1:
+            # Inter-route relocate of route[i] into other, just before or after other[j]
+            if loads[s] + q[route[i]] > Q:
+                continue
+            p = j + randrange(2) if neighbors is not None else j
+            delta = _relocate_delta(route, i, other, p, D)
+        else:
+            # Inter-route swap of route[i] and other[j]
+            if j == len(other) - 1:
+                continue
+            shift = q[other[j]] - q[route[i]]
+            if loads[r] + shift > Q or loads[s] - shift > Q:
+                continue
+            delta = _inter_swap_delta(route, i, other, j, D)
+
+        if delta > 0 and random_() >= math.exp(-delta / max(temperature, 1e-10)):
+            continue
+
+        if at_best and delta > 0:
+            best_routes = [list(x) for x in routes]   # Leaving the best solution, keep a copy
+            at_best = False
+
+        # Apply the accepted move to the touched routes only
+        if move == 0:
+            route[i], route[j] = route[j], route[i]
+        elif move == 1:
+            customer = route.pop(i)
+            other.insert(p, customer)
+            loads[r] -= q[customer]
+            loads[s] += q[customer]
+            route_of[customer] = s
+        else:
+            route[i], other[j] = other[j], route[i]
+            loads[r] += shift
+            loads[s] -= shift
+            route_of[route[i]], route_of[other[j]] = r, s
+
+        current_distance += delta
+        if current_distance < best_distance:
+            best_distance = current_distance
+            at_best = True
+
+    if at_best:
+        best_routes = [list(x) for x in routes]
+    return best_routes, best_distance
+
+def solve_cvrp(n, Q, D, q, max_iter=500000, initial_temp=10, final_temp=0.1, time_limit=None, k=10):
+    """Solves the CVRP using simulated annealing with O(1) delta evaluation (k=None for uniform partners)."""
+    routes = initial_solution(n, Q, D, q)
+    neighbors = neighbor_lists(D, k) if k else None
+    best_routes, _ = anneal(routes, Q, D, q, max_iter, initial_temp, final_temp,
+                            time_limit=time_limit, neighbors=neighbors)
+    return [route for route in best_routes if len(route) > 2]   # Drop routes emptied by relocation
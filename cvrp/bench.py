@@ -0,0 +1,218 @@
+"""
+Benchmark harness for the registered solvers.
+
+Runs every (algorithm, instance, seed) combination in its own subprocess so
+that peak memory is measured per run, and reports the same numbers the
+solver headers were recording by hand: Score, Total Time, Peak Time and
+Peak Memory.
+
+python -m cvrp.bench                                  # all solvers on 1.in-5.in
+python -m cvrp.bench --algo greedy cw sa --seeds 5
+python -m cvrp.bench --save-baseline bench_baseline.json
+python -m cvrp.bench --baseline bench_baseline.json   # exit 1 on regressions
+python -m cvrp.bench --algo greedy cw --instances 5.in gen5000.in   # see cvrp.generate
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from cvrp.registry import ROOT, SOLVERS, STOCHASTIC
+
+DEFAULT_TIMEOUT = 300   # seconds per run
+
+def default_instances():
+    """Returns the instances shipped with the repository (1.in, 2.in, ...)."""
+    return sorted(glob.glob(os.path.join(ROOT, "[0-9]*.in")))
+
+def warm_cache(instances):
+    """Builds the binary sidecar of every instance (see cvrp.cache) so that no timed run pays for it."""
+    from cvrp.instance import load_instance
+    for instance in instances:
+        load_instance(instance)
+
+def _peak_rss_mib():
+    """Peak resident set size in MiB of this process or its largest finished child (pool workers)."""
+    import resource
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024   # bytes on macOS, KiB on Linux
+
+def _worker(algo, instance, seed):
+    """Runs one solver in this process and prints its measurements as a JSON line."""
+    import random
+    from cvrp.registry import load_solver, read_for
+    from cvrp.routes import check, total_distance
+
+    if seed is not None:
+        random.seed(seed)
+    solve_cvrp = load_solver(algo)
+
+    start = time.perf_counter()
+    n, Q, D, q = read_for(algo, instance)
+    loaded = time.perf_counter()
+    routes = solve_cvrp(n, Q, D, q)
+    solved = time.perf_counter()
+
+    valid = bool(routes) and check(routes, n, Q, D, q)
+    print(json.dumps({
+        "valid": valid,
+        "cost": int(total_distance(routes, D)) if valid else None,
+        "routes": len(routes) if routes else 0,
+        "load_s": loaded - start,
+        "solve_s": solved - loaded,
+        "peak_rss_mib": _peak_rss_mib(),
+    }))
+
+def run_one(algo, instance, seed=None, timeout=DEFAULT_TIMEOUT):
+    """Runs one solver on one instance in a fresh interpreter and returns its record."""
+    record = {"algo": algo, "instance": os.path.basename(instance), "seed": seed}
+    cmd = [sys.executable, "-m", "cvrp.bench", "--worker", algo, instance, "" if seed is None else str(seed)]
+
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        record.update(status="timeout", wall_s=timeout)
+        return record
+    record["wall_s"] = time.perf_counter() - start
+
+    if proc.returncode != 0 or not proc.stdout.strip():
+        lines = proc.stderr.strip().splitlines()
+        record.update(status="error", error=lines[-1] if lines else f"exit code {proc.returncode}")
+        return record
+
+    record.update(json.loads(proc.stdout.strip().splitlines()[-1]))
+    record["status"] = "ok" if record["valid"] else "invalid"
+    return record
+
+def run_suite(algos, instances, seeds=3, timeout=DEFAULT_TIMEOUT, log=sys.stderr):
+    """Runs every algorithm on every instance; stochastic ones once per seed."""
+    warm_cache(instances)
+    records = []
+    for algo in algos:
+        run_seeds = list(range(seeds)) if algo in STOCHASTIC else [None]
+        for instance in instances:
+            for seed in run_seeds:
+                record = run_one(algo, instance, seed, timeout)
+                records.append(record)
+                if log is not None:
+                    print(f"{algo:10} {record['instance']:12} seed={seed} {record['status']:8} "
+                          f"cost={record.get('cost')} wall={record['wall_s']:.2f}s", file=log)
+    return records
+
+def summarize(records):
+    """Aggregates runs into summary[algo][instance] with median cost/time and peak memory."""
+    grouped = {}
+    for record in records:
+        grouped.setdefault(record["algo"], {}).setdefault(record["instance"], []).append(record)
+
+    summary = {}
+    for algo, by_instance in grouped.items():
+        summary[algo] = {}
+        for instance, runs in by_instance.items():
+            ok = [r for r in runs if r["status"] == "ok"]
+            summary[algo][instance] = {
+                "runs": len(runs),
+                "valid": len(ok) == len(runs),
+                "cost": statistics.median(r["cost"] for r in ok) if ok else None,
+                "best_cost": min(r["cost"] for r in ok) if ok else None,
+                "wall_s": statistics.median(r["wall_s"] for r in ok) if ok else None,
+                "solve_s": statistics.median(r["solve_s"] for r in ok) if ok else None,
+                "peak_rss_mib": max(r["peak_rss_mib"] for r in ok) if ok else None,
+            }
+    return summary
+
+def compare(summary, baseline, cost_tol=0.0, time_tol=0.25):
+    """Returns a list of regressions of `summary` against a baseline summary."""
+    regressions = []
+    for algo, by_instance in summary.items():
+        for instance, current in by_instance.items():
+            base = baseline.get(algo, {}).get(instance)
+            if base is None:
+                continue
+            label = f"{algo} on {instance}"
+
+            if base["valid"] and not current["valid"]:
+                regressions.append(f"{label}: no longer produces a valid solution")
+                continue
+            if base["cost"] is not None and current["cost"] is not None and current["cost"] > base["cost"] * (1 + cost_tol):
+                regressions.append(f"{label}: cost {current['cost']} > baseline {base['cost']}")
+            if base["wall_s"] is not None and current["wall_s"] is not None and current["wall_s"] > base["wall_s"] * (1 + time_tol):
+                regressions.append(f"{label}: wall time {current['wall_s']:.2f}s > baseline {base['wall_s']:.2f}s")
+    return regressions
+
+def print_table(summary, out=sys.stdout):
+    """Prints one line per algorithm in the Score / Total Time / Peak Time / Peak Memory format."""
+    print(f"{'algo':10} {'Score':>10} {'Total Time':>12} {'Peak Time':>10} {'Peak Memory':>12}  valid", file=out)
+    for algo in sorted(summary):
+        rows = summary[algo].values()
+        done = [r for r in rows if r["cost"] is not None]
+        score = sum(r["cost"] for r in done)
+        total_ms = sum(r["wall_s"] for r in done) * 1000
+        peak_ms = max((r["wall_s"] for r in done), default=0) * 1000
+        peak_mib = max((r["peak_rss_mib"] for r in done), default=0)
+        valid = f"{sum(r['valid'] for r in rows)}/{len(rows)}"
+        print(f"{algo:10} {score:>10.0f} {total_ms:>10.0f}ms {peak_ms:>8.0f}ms {peak_mib:>8.1f} MiB  {valid}", file=out)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "--worker":
+        _, algo, instance, seed = argv
+        _worker(algo, instance, int(seed) if seed else None)
+        return 0
+
+    parser = argparse.ArgumentParser(prog="python -m cvrp.bench", description="Benchmark the CVRP solvers.")
+    parser.add_argument("--algo", nargs="+", choices=sorted(SOLVERS), default=None,
+                        help="algorithms to run (default: all except bnb and brute)")
+    parser.add_argument("--instances", nargs="+", default=None, help=".in files (default: 1.in-5.in)")
+    parser.add_argument("--seeds", type=int, default=3, help="runs per instance for stochastic solvers")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="seconds allowed per run")
+    parser.add_argument("--output", default="bench_results.json", help="where to write the results")
+    parser.add_argument("--baseline", default=None, help="results file to compare against")
+    parser.add_argument("--save-baseline", default=None, help="also write the summary as a new baseline")
+    parser.add_argument("--cost-tol", type=float, default=0.0, help="allowed relative cost increase")
+    parser.add_argument("--time-tol", type=float, default=0.25, help="allowed relative wall time increase")
+    args = parser.parse_args(argv)
+
+    # The exact solvers cannot finish on the shipped instances, run them only on request
+    algos = args.algo or [name for name in sorted(SOLVERS) if name not in ("bnb", "brute")]
+    instances = [os.path.abspath(path) for path in (args.instances or default_instances())]
+
+    records = run_suite(algos, instances, args.seeds, args.timeout)
+    summary = summarize(records)
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seeds": args.seeds,
+        },
+        "summary": summary,
+        "runs": records,
+    }
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+    print_table(summary)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["summary"]
+        regressions = compare(summary, baseline, args.cost_tol, args.time_tol)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,598 @@
+"""
+Exact branch and bound for small instances.
+
+Two searches share the incumbent (Clarke-Wright multi-start + local search,
+so pruning is effective from the first node) and a time limit:
+
+Route-level search (route_branch_and_bound), used whenever every
+capacity-feasible customer set can be enumerated (cvrp.subsets, at most
+ROUTE_LIMIT of them). Each node is a bitmask of the customers served so
+far; a child adds one whole route that contains the lowest unserved
+customer, so every partition into routes is generated exactly once. The
+bound gives each customer v a price pi[v] such that no route costs less
+than the prices of its customers (a dual solution of the set-partitioning
+LP, found by coordinate ascent); the customers still unserved then cost at
+least the sum of their prices. A node is only the bitmask and its cost,
+with a parent map from which the routes of the final solution are read back.
+
+Customer-level search (branch_and_bound), the fallback. Solutions are built
+one route at a time: a node either extends the open route with an unvisited
+customer that fits, or returns it to the depot. Each node is a flat tuple
+(bound, cost, mask, last, load, remaining, anchor, first, id): `mask` is the
+bitmask of visited customers and `id` indexes a parent-pointer arena holding
+only (parent, location). Nothing is copied per node. Pruning:
+
+- degree bound: in any completion every unvisited customer has two more
+  edges, the end of the open route one, and the depot one per route end
+  still to come, with the number of further routes bounded below by the
+  remaining demand over Q (a bin-packing bound). Half the sum of each
+  location's cheapest such edges is a valid lower bound on the remaining
+  cost; so is a radial bound (see make_bound) and the larger one is used;
+- symmetry: a route must contain the lowest-numbered customer left when it
+  was opened, and with a symmetric D its first customer must be lower than
+  its last, so every set of routes is generated once in one orientation;
+- dominance: a state (mask, last, load, anchor, first) reached again at no
+  lower cost is dropped.
+
+Both searches are best-first, which keeps every open node. depth_first()
+walks either tree depth-first (optionally as limited discrepancy search)
+in O(depth) memory and reports the incumbent and a certified gap as it goes;
+cvrp.parallel_bnb runs the same search on several processes.
+"""
+
+import heapq
+import itertools
+import math
+import random
+import sys
+import time
+
+import numpy as np
+
+from cvrp.local_search import or_opt
+from cvrp.multistart import run_start, start_parameters
+from cvrp.subsets import RouteCache, route_costs
+
+ROUTE_LIMIT = 200000    # Largest number of feasible customer sets the route-level search enumerates
+EPS = 1e-6              # Slack for the floating-point prices in route-level bounds
+
+def incumbent(n, Q, D, q, starts=32, cache=None):
+    """Best of several randomised Clarke-Wright + 2-opt + Or-opt runs; returns (cost, routes).
+
+    With a RouteCache, a route whose customer set has a cheaper known cost
+    is replaced by its optimal order.
+    """
+    D_array = np.asarray(D)
+    best = None
+    for lam, noise, seed in start_parameters(starts, random.Random(0)):
+        _, routes = run_start(D_array, Q, q, lam, noise, seed)
+        routes = [or_opt(route, D) for route in routes]
+        if cache is not None:
+            routes = [_best_known(route, D, cache) for route in routes]
+        cost = sum(D[a][b] for route in routes for a, b in zip(route, route[1:]))
+        if best is None or cost < best[0]:
+            best = (cost, routes)
+    return best
+
+def _best_known(route, D, cache):
+    mask = sum(1 << c for c in route[1:-1])
+    known = cache.cost(mask)
+    if known is not None and known < sum(D[a][b] for a, b in zip(route, route[1:])):
+        return cache.route(mask)[1]
+    return route
+
+def metric_closure(D):
+    """Shortest-path distances (Floyd-Warshall); never above D and always satisfying the triangle inequality."""
+    closure = np.array(D, dtype=np.int64)
+    for k in range(len(closure)):
+        np.minimum(closure, closure[:, k, None] + closure[None, k, :], out=closure)
+    return closure.tolist()
+
+def make_bound(n, Q, D, q):
+    """Returns (bound, ends, radial) for the lower bound on the cost of completing a node.
+
+    ends[v] is the least cost of v's two edges; radial[v] is q[v] times the
+    depot distance in D's metric closure. bound(cost, last, load, remaining,
+    free, ends_left, radial_left) takes the sums of both over the unvisited
+    customers, kept up to date by the caller so they cost O(1), and returns
+    the larger of:
+
+    - the degree bound, half the cheapest edges every location still needs;
+    - the radial bound: a route serving customers S costs at least twice the
+      largest depot distance in S, hence at least 2 / Q * sum(radial[S]);
+      customers that can still ride in the open route are credited with the
+      best fractional fill of its spare capacity.
+    """
+    ends = [0] * n
+    nearest = [0] * n
+    for v in range(n):
+        edges = sorted(D[v][u] for u in range(n) if u != v)
+        nearest[v] = edges[0]
+        if v:
+            # The two cheapest edges may both go to the depot, as in the route [0, v, 0]
+            ends[v] = min(sum(edges[:2]), 2 * D[v][0])
+    depot_edges = sorted((D[0][c], c) for c in range(1, n))
+
+    metric = metric_closure(D)
+    radial = [q[v] * metric[0][v] for v in range(n)]
+    farthest = sorted(range(1, n), key=lambda v: -metric[0][v])
+
+    def bound(cost, last, load, remaining, free, ends_left, radial_left):
+        if not free:
+            return cost + (D[last][0] if last else 0)
+
+        # Routes still to open: the open route can take Q - load more (bin-packing bound)
+        spill = remaining - (Q - load) if last else remaining
+        depot_degree = 2 * -(-max(spill, 0) // Q) + (1 if last else 0)
+
+        twice = ends_left + nearest[last] if last else ends_left
+        # Depot side: each unvisited customer can take up to two depot edges, the open route's end one
+        for d, c in depot_edges:
+            if free >> c & 1:
+                use = 2
+            elif c == last:
+                use = 1
+            else:
+                continue
+            use = min(use, depot_degree)
+            twice += use * d
+            depot_degree -= use
+            if not depot_degree:
+                break
+        degree_bound = -(-twice // 2)
+
+        if last:
+            # The open route still has to get home and may absorb up to Q - load of demand for free
+            spare, credit = Q - load, 0
+            for v in farthest:
+                if free >> v & 1:
+                    take = min(q[v], spare)
+                    credit += take * metric[0][v]
+                    spare -= take
+                    if not spare:
+                        break
+            radial_bound = metric[last][0] + -(-2 * (radial_left - credit) // Q)
+        else:
+            radial_bound = -(-2 * radial_left // Q)
+        return cost + max(degree_bound, radial_bound)
+
+    return bound, ends, radial
+
+def _symmetric(D, n):
+    return all(D[i][j] == D[j][i] for i in range(n) for j in range(i))
+
+def _routes_from(arena, node_id):
+    """Walks the parent pointers back to the root and cuts the location sequence into routes."""
+    sequence = []
+    while node_id:
+        node_id, location = arena[node_id]
+        sequence.append(location)
+    sequence.reverse()
+    return _cut_routes(sequence)
+
+def _cut_routes(sequence):
+    """Splits a sequence of visited locations, with 0 closing each route, into depot-to-depot routes."""
+    routes, route = [], [0]
+    for location in sequence:
+        route.append(location)
+        if location == 0:
+            routes.append(route)
+            route = [0]
+    return routes
+
+def branch_and_bound(n, Q, D, q, time_limit=None, initial=None):
+    """Returns (cost, routes, proven): best-first search, proven is False if time_limit stopped it early."""
+    deadline = None if time_limit is None else time.perf_counter() + time_limit   # Setup counts too
+    if n <= 1:
+        return 0, [], True
+    if initial is None:
+        initial = incumbent(n, Q, D, q)
+    best_cost, best_routes = initial
+    bound, ends, radial = make_bound(n, Q, D, q)
+    symmetric = _symmetric(D, n)
+    full = (1 << n) - 2
+
+    arena = [(0, 0)]    # (parent id, location) per node; location 0 closes a route
+    seen = {}           # (mask, last, load, anchor, first) -> cheapest cost so far
+    # (bound, cost, mask, last, load, remaining demand, ends left, radial left, anchor, first, id)
+    # last 0 means no route is open
+    remaining, ends_left, radial_left = sum(q[1:]), sum(ends), sum(radial)
+    heap = [(bound(0, 0, 0, remaining, full, ends_left, radial_left),
+             0, 0, 0, 0, remaining, ends_left, radial_left, 0, 0, 0)]
+    expanded = 0
+
+    while heap:
+        lb, cost, mask, last, load, remaining, ends_left, radial_left, anchor, first, node_id = heapq.heappop(heap)
+        if lb >= best_cost:
+            break       # Best-first: nothing left can improve on the incumbent
+        # An expansion scans every free customer, so on a hundred customers 1024 of them take seconds
+        if deadline is not None and not expanded & 63 and time.perf_counter() > deadline:
+            return best_cost, best_routes, False
+        expanded += 1
+        free = full & ~mask
+
+        if last == 0:
+            # Open a new route; it must contain the lowest unvisited customer
+            anchor = (free & -free).bit_length() - 1
+            candidates = [c for c in range(1, n) if free >> c & 1]
+        else:
+            candidates = [c for c in range(1, n) if free >> c & 1 and load + q[c] <= Q]
+            # Close the open route
+            if mask >> anchor & 1 and (not symmetric or first <= last):
+                child_cost = cost + D[last][0]
+                if not free:
+                    if child_cost < best_cost:
+                        arena.append((node_id, 0))
+                        best_cost, best_routes = child_cost, _routes_from(arena, len(arena) - 1)
+                else:
+                    key = (mask, 0, 0, 0, 0)
+                    if child_cost < seen.get(key, best_cost):
+                        seen[key] = child_cost
+                        child_lb = bound(child_cost, 0, 0, remaining, free, ends_left, radial_left)
+                        if child_lb < best_cost:
+                            arena.append((node_id, 0))
+                            heapq.heappush(heap, (child_lb, child_cost, mask, 0, 0, remaining, ends_left,
+                                                  radial_left, 0, 0, len(arena) - 1))
+
+        for c in candidates:
+            child_cost = cost + D[last][c]
+            child_mask = mask | 1 << c
+            child_load = load + q[c]
+            child_first = c if last == 0 else first
+            key = (child_mask, c, child_load, anchor, child_first)
+            if child_cost >= seen.get(key, best_cost):
+                continue
+            seen[key] = child_cost
+            child_lb = bound(child_cost, c, child_load, remaining - q[c], free & ~(1 << c),
+                             ends_left - ends[c], radial_left - radial[c])
+            if child_lb < best_cost:
+                arena.append((node_id, c))
+                heapq.heappush(heap, (child_lb, child_cost, child_mask, c, child_load, remaining - q[c],
+                                      ends_left - ends[c], radial_left - radial[c], anchor, child_first,
+                                      len(arena) - 1))
+
+    return best_cost, best_routes, True
+
+def dual_prices(n, costs, loads, q):
+    """Returns prices pi with sum(pi[v] for v in S) <= costs[S] for every feasible set S.
+
+    Each customer's share q[v] * min(cost / load), over the routes it can
+    ride in, already satisfies every route. Starting from a fraction of the
+    shares, customers are raised one at a time by the least slack among
+    their routes. The result depends heavily on the starting fraction and
+    on the order customers are raised in, so a few of each are tried and
+    the prices with the largest sum are kept.
+    """
+    masks = list(costs)
+    members = [[v for v in range(1, n) if mask >> v & 1] for mask in masks]
+    routes_of = [[] for _ in range(n)]
+    for i, customers in enumerate(members):
+        for v in customers:
+            routes_of[v].append(i)
+
+    customers = [v for v in range(1, n) if routes_of[v]]
+    share = [0.0] * n
+    for v in customers:
+        share[v] = q[v] * min(costs[masks[i]] / loads[masks[i]] for i in routes_of[v])
+
+    orders = [
+        sorted(customers, key=lambda v: -q[v]),                 # Large demands first
+        sorted(customers, key=lambda v: len(routes_of[v])),     # Fewest routes first
+        sorted(customers, key=lambda v: share[v] / q[v]),       # Cheapest per unit first
+    ]
+    best = None
+    for fraction in (0.5, 1.0):
+        for order in orders:
+            prices = [fraction * price for price in share]
+            slack = [costs[mask] - sum(prices[v] for v in route) for mask, route in zip(masks, members)]
+            for v in order:
+                raise_by = min(slack[i] for i in routes_of[v])
+                if raise_by > 0:
+                    prices[v] += raise_by
+                    for i in routes_of[v]:
+                        slack[i] -= raise_by
+            if best is None or sum(prices) > sum(best):
+                best = prices
+    return best
+
+def _routes_by_anchor(n, costs, prices):
+    """Groups the routes by their lowest customer as (reduced cost, cost, mask, price), cheapest reduced cost first."""
+    by_anchor = [[] for _ in range(n)]
+    for mask, cost in costs.items():
+        price = sum(prices[v] for v in range(1, n) if mask >> v & 1)
+        by_anchor[(mask & -mask).bit_length() - 1].append((cost - price, cost, mask, price))
+    for routes in by_anchor:
+        routes.sort()
+    return by_anchor
+
+def route_branch_and_bound(n, Q, D, q, costs, loads, time_limit=None, initial=None, cache=None):
+    """Returns (cost, routes, proven) by best-first search over sets of whole routes.
+
+    costs and loads come from cvrp.subsets.route_costs(); proven is False if
+    time_limit stopped the search early.
+    """
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    if cache is None:
+        cache = RouteCache(D)
+        cache.keep(costs, loads)
+    if initial is None:
+        initial = incumbent(n, Q, D, q, cache=cache)
+    best_cost, best_routes = initial
+    prices = dual_prices(n, costs, loads, q)
+
+    by_anchor = _routes_by_anchor(n, costs, prices)
+
+    full = (1 << n) - 2
+    if any(not by_anchor[c] for c in range(1, n)):
+        return best_cost, best_routes, True      # Some customer fits in no vehicle
+    parent = {0: (0, None)}     # mask -> (cheapest cost, mask before its last route)
+    price_left = sum(prices)
+    heap = [(price_left, 0, 0, price_left)]     # (bound, cost, mask, prices of the unserved)
+    expanded = 0
+    best_mask = None
+
+    while heap:
+        lb, cost, mask, price_left = heapq.heappop(heap)
+        if lb + EPS >= best_cost:
+            break
+        if cost > parent[mask][0]:
+            continue    # Stale entry, the mask was reached more cheaply since
+        if deadline is not None and not expanded & 63 and time.perf_counter() > deadline:
+            return best_cost, _routes_of(best_mask, parent, cache) if best_mask else best_routes, False
+        expanded += 1
+
+        free = full & ~mask
+        for reduced, route_cost, route, price in by_anchor[(free & -free).bit_length() - 1]:
+            if lb + reduced + EPS >= best_cost:
+                break   # The remaining routes have larger reduced costs
+            if route & mask:
+                continue
+            child_cost = cost + route_cost
+            child = mask | route
+            if child in parent and child_cost >= parent[child][0]:
+                continue
+            parent[child] = (child_cost, mask)
+            if child == full:
+                best_cost, best_mask = child_cost, child
+            else:
+                heapq.heappush(heap, (child_cost + price_left - price, child_cost, child, price_left - price))
+
+    return best_cost, _routes_of(best_mask, parent, cache) if best_mask else best_routes, True
+
+def _routes_of(mask, parent, cache):
+    """Reads the customer sets back from the parent map and orders each one optimally."""
+    routes = []
+    while mask:
+        previous = parent[mask][1]
+        routes.append(cache.route(mask & ~previous)[1])
+        mask = previous
+    routes.reverse()
+    return routes
+
+def _route_tree(n, costs, prices):
+    """Returns (root, root bound, expand) for the route-level tree; children come by reduced cost."""
+    by_anchor = _routes_by_anchor(n, costs, prices)
+    full = (1 << n) - 2
+
+    def expand(state, best_cost):
+        cost, mask, price_left = state
+        free = full & ~mask
+        children = []
+        for reduced, route_cost, route, price in by_anchor[(free & -free).bit_length() - 1]:
+            child_lb = cost + price_left + reduced
+            if child_lb + EPS >= best_cost:
+                break
+            if route & mask:
+                continue
+            child = mask | route
+            children.append((child_lb, cost + route_cost, (cost + route_cost, child, price_left - price),
+                             route, child == full))
+        return children
+
+    return (0, 0, sum(prices)), sum(prices), expand
+
+def _customer_tree(n, Q, D, q):
+    """Returns (root, root bound, expand) for the customer-level tree; children come by bound, then cost."""
+    bound, ends, radial = make_bound(n, Q, D, q)
+    symmetric = _symmetric(D, n)
+    full = (1 << n) - 2
+
+    def expand(state, best_cost):
+        cost, mask, last, load, remaining, ends_left, radial_left, anchor, first = state
+        free = full & ~mask
+        children = []
+        if last == 0:
+            anchor = (free & -free).bit_length() - 1
+            candidates = [c for c in range(1, n) if free >> c & 1]
+        else:
+            candidates = [c for c in range(1, n) if free >> c & 1 and load + q[c] <= Q]
+            if mask >> anchor & 1 and (not symmetric or first <= last):
+                child_cost = cost + D[last][0]
+                if not free:
+                    children.append((child_cost, child_cost, None, 0, True))
+                else:
+                    child_lb = bound(child_cost, 0, 0, remaining, free, ends_left, radial_left)
+                    if child_lb < best_cost:
+                        children.append((child_lb, child_cost, (child_cost, mask, 0, 0, remaining, ends_left,
+                                                                radial_left, 0, 0), 0, False))
+
+        for c in candidates:
+            child_cost = cost + D[last][c]
+            child_load = load + q[c]
+            child_lb = bound(child_cost, c, child_load, remaining - q[c], free & ~(1 << c),
+                             ends_left - ends[c], radial_left - radial[c])
+            if child_lb < best_cost:
+                children.append((child_lb, child_cost, (child_cost, mask | 1 << c, c, child_load, remaining - q[c],
+                                                        ends_left - ends[c], radial_left - radial[c], anchor,
+                                                        c if last == 0 else first), c, False))
+        children.sort(key=lambda child: child[:2])
+        return children
+
+    remaining, ends_left, radial_left = sum(q[1:]), sum(ends), sum(radial)
+    root = (0, 0, 0, 0, remaining, ends_left, radial_left, 0, 0)
+    return root, bound(0, 0, 0, remaining, full, ends_left, radial_left), expand
+
+def _open_bound(stack, best_cost, skipped):
+    """Least bound over the children still waiting on the stack, the ones cut so far and the incumbent."""
+    return min([best_cost, skipped] + [child[0] for children, index, _, _ in stack for child in children[index:]])
+
+def _depth_first(root, expand, best_cost, limit=None, deadline=None, poll=None):
+    """One depth-first pass; returns (best_cost, found, skipped, finished).
+
+    expand(state, best_cost) lists a node's children as (bound, cost,
+    state, step, complete), most promising first; found is (cost, steps)
+    for the best solution reached, or None if nothing beat best_cost. The
+    stack holds one frame per level, so memory is O(depth * branching).
+
+    With a limit, taking any surviving child of a node but the first is a
+    discrepancy and paths with more than `limit` of them are cut; skipped is
+    the least bound among the children cut. finished is False if the
+    deadline stopped the pass.
+
+    Every few hundred nodes poll(best_cost, stack, path, skipped) is called
+    and returns the incumbent cost to prune with from then on. It may also
+    take children out of the stack frames; path holds the steps to the node
+    whose children are in the last frame.
+    """
+    found, skipped = None, math.inf
+    path = []
+    stack = [[expand(root, best_cost), 0, 0, 0]]    # children, next child, discrepancies so far, children tried
+    expanded = 0
+
+    while stack:
+        frame = stack[-1]
+        children, index, used, tried = frame
+        if index == len(children):
+            stack.pop()
+            if path:
+                path.pop()
+            continue
+        frame[1] = index + 1
+        child_lb, child_cost, state, step, complete = children[index]
+        if child_lb + EPS >= best_cost:
+            continue
+        frame[3] = tried + 1
+        child_used = used + (tried > 0)
+        if limit is not None and child_used > limit:
+            skipped = min(skipped, child_lb)
+            continue
+        if complete:
+            best_cost = child_cost
+            found = (child_cost, path + [step])
+            continue
+
+        expanded += 1
+        if deadline is not None and not expanded & 255 and time.perf_counter() > deadline:
+            return best_cost, found, _open_bound(stack, best_cost, min(skipped, child_lb)), False
+        path.append(step)
+        stack.append([expand(state, best_cost), 0, child_used, 0])
+        if poll is not None and not expanded & 255:
+            best_cost = poll(best_cost, stack, path, skipped)
+
+    return best_cost, found, skipped, True
+
+def depth_first(n, Q, D, q, time_limit=None, initial=None, discrepancy=False, report_every=None,
+                route_limit=ROUTE_LIMIT, log=sys.stderr, cache=None):
+    """Returns (cost, routes, lower_bound) by depth-first branch and bound in O(depth) memory.
+
+    Searches the route-level tree when the feasible routes can be
+    enumerated, the customer-level one otherwise, always trying the most
+    promising child first. With discrepancy=True the search is limited
+    discrepancy search: pass k only follows paths that leave the preferred
+    child at most k times, for k = 0, 1, 2, ... until a pass cuts nothing,
+    so good solutions are reached early and the last pass proves optimality.
+
+    lower_bound certifies the result: no solution costs less, and it equals
+    cost when the search finished. With report_every, a line with the
+    incumbent, the bound and the gap is printed to `log` that often (seconds).
+    """
+    start = time.perf_counter()
+    if n <= 1:
+        return 0, [], 0
+    if cache is None:
+        cache = RouteCache(D)
+    enumerated = route_costs(n, Q, D, q, route_limit, cache)
+    if initial is None:
+        initial = incumbent(n, Q, D, q, cache=cache)
+    best_cost, best_routes = initial
+    deadline = None if time_limit is None else start + time_limit
+
+    if enumerated is not None:
+        root, lower, expand = _route_tree(n, enumerated[0], dual_prices(n, *enumerated, q))
+    else:
+        root, lower, expand = _customer_tree(n, Q, D, q)
+
+    next_report = start + (report_every or 0)
+
+    def show(best_cost, lower):
+        lower = min(best_cost, math.ceil(lower - EPS))
+        gap = (best_cost - lower) / best_cost if best_cost else 0
+        print(f"bnb {time.perf_counter() - start:8.1f}s  incumbent {best_cost}  bound {lower}  gap {gap:.2%}", file=log)
+
+    def report(best_cost, stack, path, skipped):
+        nonlocal next_report
+        if time.perf_counter() >= next_report:
+            # Earlier discrepancy passes may have certified more than the current pass's open nodes
+            show(best_cost, max(proven, _open_bound(stack, best_cost, skipped)))
+            next_report = time.perf_counter() + report_every
+        return best_cost
+
+    best_path, proven = None, lower
+    for limit in itertools.count() if discrepancy else [None]:
+        best_cost, found, skipped, finished = _depth_first(root, expand, best_cost, limit, deadline,
+                                                            report if report_every else None)
+        if found is not None:
+            best_path = found[1]
+        if not finished:
+            lower = max(lower, skipped)
+            break
+        lower = proven = max(lower, min(skipped, best_cost))
+        if skipped + EPS >= best_cost:
+            break       # Nothing was cut, or nothing cut can beat the incumbent
+    if best_path is not None:
+        best_routes = _routes_from_steps(best_path, enumerated is not None, cache)
+    if report_every:
+        show(best_cost, lower)
+        stats = cache.stats()
+        print(f"bnb route cache: {stats['costs']} costs, {stats['routes']} routes, {stats['hits']} hits, "
+              f"{stats['misses']} misses", file=log)
+    return best_cost, best_routes, min(best_cost, lower)
+
+def _routes_from_steps(steps, by_route, cache):
+    """Turns the steps of a tree path (route masks or visited locations) into routes."""
+    if by_route:
+        return [cache.route(route)[1] for route in steps]
+    return _cut_routes(steps)
+
+def solve_cvrp(n, Q, D, q, time_limit=None, route_limit=ROUTE_LIMIT, mode="best-first", report_every=None,
+               workers=None):
+    """Solves the CVRP exactly by branch and bound (best found so far if time_limit runs out).
+
+    mode="best-first" expands the node with the least bound next,
+    "depth-first" and "discrepancy" run depth_first() in bounded memory and
+    "parallel" runs the depth-first search on `workers` processes
+    (cvrp.parallel_bnb). time_limit counts from the call, enumeration
+    included; None means no limit.
+    """
+    if mode not in ("best-first", "depth-first", "discrepancy", "parallel"):
+        raise ValueError(f"unknown search mode {mode!r}")
+    start = time.perf_counter()
+    if n <= 1:
+        return []
+    cache = RouteCache(D)
+    if mode == "parallel":
+        from cvrp.parallel_bnb import parallel_depth_first    # Imports this module
+        _, routes, _ = parallel_depth_first(n, Q, D, q, workers, time_limit, route_limit=route_limit, cache=cache)
+        return routes
+    if mode != "best-first":
+        _, routes, _ = depth_first(n, Q, D, q, time_limit, discrepancy=mode == "discrepancy",
+                                   report_every=report_every, route_limit=route_limit, cache=cache)
+        return routes
+    enumerated = route_costs(n, Q, D, q, route_limit, cache)
+    if time_limit is not None:
+        time_limit = max(0, time_limit - (time.perf_counter() - start))   # The enumeration counts too
+    if enumerated is None:
+        _, routes, _ = branch_and_bound(n, Q, D, q, time_limit)
+    else:
+        _, routes, _ = route_branch_and_bound(n, Q, D, q, *enumerated, time_limit=time_limit, cache=cache)
+    return routes
@@ -0,0 +1,102 @@
+"""
+Binary sidecar cache for parsed instances.
+
+The first time an .in file is loaded its parsed matrix is written next to it
+as <name>.in.bin; later loads memory-map that file instead of re-parsing the
+text, so several solver processes share one page-cached copy of D.
+
+Layout (little endian):
+
+    64 byte header   magic, version, dtype, n, Q, sha256 of the .in text
+    n * n values     distance matrix, row major
+    n values         demand vector
+
+The header carries the content hash of the source text, so a sidecar left
+behind after the .in file changes is detected and rebuilt.
+"""
+
+import hashlib
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"CVRPBIN\0"
+VERSION = 1
+HEADER = struct.Struct("<8sI4sqq32s")   # 64 bytes, keeps the matrix 64-byte aligned
+SUFFIX = ".bin"
+
+def content_digest(data):
+    """Returns the sha256 digest that keys a sidecar to its source text."""
+    return hashlib.sha256(data).digest()
+
+def sidecar_path(path):
+    """Returns the sidecar path used for an instance file."""
+    return os.fspath(path) + SUFFIX
+
+def write_binary(path, n, Q, D, q, digest):
+    """Writes an instance in binary form, atomically replacing any existing file."""
+    D = np.ascontiguousarray(D)
+    q = np.ascontiguousarray(q, dtype=D.dtype)
+    header = HEADER.pack(MAGIC, VERSION, D.dtype.str.encode("ascii"), n, Q, digest)
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(header)
+            f.write(D.tobytes())
+            f.write(q.tobytes())
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def read_header(path):
+    """Reads and validates a sidecar header, returning (dtype, n, Q, digest)."""
+    with open(path, "rb") as f:
+        raw = f.read(HEADER.size)
+    if len(raw) != HEADER.size:
+        raise ValueError(f"{path}: truncated header")
+
+    magic, version, dtype, n, Q, digest = HEADER.unpack(raw)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: not a version {VERSION} CVRP binary instance")
+
+    try:
+        dtype = np.dtype(dtype.rstrip(b"\0").decode("ascii"))
+    except (TypeError, UnicodeDecodeError):
+        raise ValueError(f"{path}: bad dtype field {dtype!r}") from None
+    if dtype.kind not in "iu" or n < 1:
+        raise ValueError(f"{path}: bad header (dtype={dtype}, n={n})")
+    expected = HEADER.size + (n * n + n) * dtype.itemsize
+    if os.path.getsize(path) != expected:
+        raise ValueError(f"{path}: size does not match header (n={n})")
+    return dtype, n, Q, digest
+
+def open_binary(path, digest=None):
+    """Memory-maps a binary instance and returns n, Q, D and q as read-only arrays."""
+    dtype, n, Q, stored = read_header(path)
+    if digest is not None and stored != digest:
+        raise ValueError(f"{path}: stale cache, source content changed")
+
+    D = np.memmap(path, dtype=dtype, mode="r", offset=HEADER.size, shape=(n, n))
+    q = np.memmap(path, dtype=dtype, mode="r", offset=HEADER.size + n * n * dtype.itemsize, shape=(n,))
+    return n, Q, D, q
+
+def load_cached(path, data, parse):
+    """Returns the instance for the .in text `data` read from `path`, going through its sidecar."""
+    digest = content_digest(data)
+    cache = sidecar_path(path)
+
+    if os.path.exists(cache):
+        try:
+            return open_binary(cache, digest)
+        except (ValueError, TypeError, UnicodeDecodeError):
+            pass    # Stale or corrupt, rebuild below
+
+    n, Q, D, q = parse(data)
+    try:
+        write_binary(cache, n, Q, D, q, digest)
+    except OSError:
+        pass        # Read-only location, the parsed arrays are still good
+    return n, Q, D, q
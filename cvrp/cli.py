@@ -0,0 +1,65 @@
+"""
+Single entry point for every solver:
+
+python -m cvrp solve --algo greedy < 1.in > 1.out
+python -m cvrp solve --algo cw --param k=30 < 5.in
+python -m cvrp list
+"""
+
+import argparse
+import ast
+import random
+import sys
+
+from cvrp.registry import SOLVERS, load_solver, read_for
+
+def parse_param(pair):
+    """Turns "k=30" into ("k", 30); used as the argparse type of --param, so bad input is a usage error."""
+    key, sep, value = pair.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"expected key=value, got {pair!r}")
+    try:
+        return key, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return key, value       # Plain strings need no quotes
+
+def solve(args):
+    from cvrp.routes import check, total_distance
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    solve_cvrp = load_solver(args.algo)
+    n, Q, D, q = read_for(args.algo, args.instance)
+    routes = solve_cvrp(n, Q, D, q, **dict(args.param))
+
+    if not routes or not check(routes, n, Q, D, q):
+        print(f"{args.algo}: solver returned an invalid solution", file=sys.stderr)
+        return 1
+
+    for route in routes:
+        print(" ".join(map(str, route)))
+    if args.cost:
+        print(f"cost {total_distance(routes, D)}", file=sys.stderr)
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="cvrp", description="Capacitated Vehicle Routing Problem solvers.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solve_parser = commands.add_parser("solve", help="solve an instance and print one route per line")
+    solve_parser.add_argument("--algo", required=True, choices=sorted(SOLVERS), help="algorithm to run")
+    solve_parser.add_argument("--seed", type=int, default=None, help="seed for the stochastic solvers")
+    solve_parser.add_argument("--cost", action="store_true", help="report the total distance on stderr")
+    solve_parser.add_argument("--param", action="append", default=[], type=parse_param, metavar="KEY=VALUE",
+                              help="extra keyword argument for the solver, e.g. --param k=30")
+    solve_parser.add_argument("instance", nargs="?", default=None, help=".in file to read (default: stdin)")
+
+    commands.add_parser("list", help="list the registered algorithms")
+
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        for name in sorted(SOLVERS):
+            print(f"{name:10} {SOLVERS[name]}")
+        return 0
+    return solve(args)
@@ -0,0 +1,160 @@
+"""
+Seeded synthetic instance generator for scaling tests beyond 5.in (n=908).
+
+python -m cvrp.generate 5000 -o gen5000.in
+python -m cvrp.generate 20000 -o gen20000.in --layout clustered --metric perturbed --binary
+
+The matrix is produced and written in row blocks, so memory stays at
+O(block * n) even for 20k locations. Defaults mirror the shipped
+instances: coordinates in a 100 x 100 square, demands uniform in 1-49 and
+roughly 3.6 customers per vehicle.
+"""
+
+import argparse
+import hashlib
+import sys
+
+import numpy as np
+
+from cvrp.cache import HEADER, MAGIC, VERSION, sidecar_path
+
+BLOCK_ROWS = 256
+
+def generate_coordinates(n, rng, layout="random", clusters=8, size=100.0):
+    """Returns n (x, y) points with the depot (index 0) at the centre of the square."""
+    if layout == "random":
+        points = rng.uniform(0, size, (n, 2))
+    elif layout == "clustered":
+        centres = rng.uniform(0.1 * size, 0.9 * size, (clusters, 2))
+        owner = rng.integers(0, clusters, n)
+        points = centres[owner] + rng.normal(0, 0.05 * size, (n, 2))
+        np.clip(points, 0, size, out=points)
+    else:
+        raise ValueError(f"unknown layout {layout!r}")
+
+    points[0] = size / 2
+    return points
+
+def generate_demands(n, rng, distribution="uniform", low=1, high=49):
+    """Returns the demand vector; the depot always has demand 0."""
+    if distribution == "uniform":
+        q = rng.integers(low, high + 1, n)
+    elif distribution == "lognormal":
+        mean = (low + high) / 4
+        q = np.rint(rng.lognormal(np.log(mean), 0.6, n))
+    elif distribution == "bimodal":
+        # Mostly small drops with a few bulky ones
+        small = rng.integers(low, max(low, high // 4) + 1, n)
+        large = rng.integers(max(low, 3 * high // 4), high + 1, n)
+        q = np.where(rng.random(n) < 0.8, small, large)
+    else:
+        raise ValueError(f"unknown demand distribution {distribution!r}")
+
+    q = np.clip(q, low, high).astype(np.int32)
+    q[0] = 0
+    return q
+
+def capacity_for(q, route_size):
+    """Vehicle capacity that fits about `route_size` average customers (smaller = tighter)."""
+    return max(int(q.max()), int(round(q[1:].mean() * route_size)))
+
+def distance_rows(points, start, stop, metric="euclidean", factors=None):
+    """Returns rows start:stop of the rounded distance matrix as int32."""
+    diff = points[start:stop, None, :] - points[None, :, :]
+    dist = np.sqrt((diff * diff).sum(axis=2))
+    if metric == "perturbed":
+        # Per-location detour factors keep the matrix symmetric and the diagonal zero
+        dist *= 1 + (factors[start:stop, None] + factors[None, :]) / 2
+    elif metric != "euclidean":
+        raise ValueError(f"unknown metric {metric!r}")
+    return np.rint(dist).astype(np.int32)
+
+def _setup(n, seed, layout, clusters, size, metric, detour, distribution, route_size):
+    rng = np.random.default_rng(seed)
+    points = generate_coordinates(n, rng, layout, clusters, size)
+    factors = rng.uniform(0, detour, n) if metric == "perturbed" else None
+    q = generate_demands(n, rng, distribution)
+    return points, factors, q, capacity_for(q, route_size)
+
+def generate_instance(n, seed=0, layout="random", clusters=8, size=100.0, metric="euclidean",
+                      detour=0.3, distribution="uniform", route_size=3.6):
+    """Generates an instance in memory and returns n, Q, D and q."""
+    points, factors, q, Q = _setup(n, seed, layout, clusters, size, metric, detour, distribution, route_size)
+    D = distance_rows(points, 0, n, metric, factors)
+    return n, Q, D, q
+
+def _format_rows(block):
+    return "".join(" ".join(map(str, row)) + "\n" for row in block.tolist()).encode("ascii")
+
+def _chunks(n, Q, q, points, factors, metric):
+    """Yields the .in text in pieces, each with the int32 rows it encodes (None for the header)."""
+    yield f"{n}\n{Q}\n".encode("ascii"), None
+    for start in range(0, n, BLOCK_ROWS):
+        block = distance_rows(points, start, min(n, start + BLOCK_ROWS), metric, factors)
+        yield _format_rows(block), block
+    yield _format_rows(q[None, :]), q
+
+def write_stream(out, n, seed=0, layout="random", clusters=8, size=100.0, metric="euclidean",
+                 detour=0.3, distribution="uniform", route_size=3.6):
+    """Writes a generated instance in .in format to a binary stream, one block of rows at a time."""
+    points, factors, q, Q = _setup(n, seed, layout, clusters, size, metric, detour, distribution, route_size)
+    for text, _ in _chunks(n, Q, q, points, factors, metric):
+        out.write(text)
+    return Q
+
+def write_instance(path, n, seed=0, layout="random", clusters=8, size=100.0, metric="euclidean",
+                   detour=0.3, distribution="uniform", route_size=3.6, binary=False):
+    """Writes a generated instance to `path` in .in format, plus its binary sidecar if asked."""
+    points, factors, q, Q = _setup(n, seed, layout, clusters, size, metric, detour, distribution, route_size)
+    digest = hashlib.sha256()
+
+    sidecar = None
+    if binary:
+        sidecar = open(sidecar_path(path), "wb")
+        sidecar.write(b"\0" * HEADER.size)    # Header is filled in once the text digest is known
+
+    try:
+        with open(path, "wb") as f:
+            for text, rows in _chunks(n, Q, q, points, factors, metric):
+                f.write(text)
+                digest.update(text)
+                if sidecar is not None and rows is not None:
+                    sidecar.write(rows.tobytes())   # D row blocks, then q
+
+        if sidecar is not None:
+            sidecar.seek(0)
+            sidecar.write(HEADER.pack(MAGIC, VERSION, np.dtype(np.int32).str.encode("ascii"), n, Q, digest.digest()))
+    finally:
+        if sidecar is not None:
+            sidecar.close()
+    return Q
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m cvrp.generate", description="Generate a synthetic CVRP instance.")
+    parser.add_argument("n", type=int, help="number of locations including the depot")
+    parser.add_argument("-o", "--output", default=None, help=".in file to write (default: stdout)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--layout", choices=["random", "clustered"], default="random")
+    parser.add_argument("--clusters", type=int, default=8, help="number of clusters for --layout clustered")
+    parser.add_argument("--size", type=float, default=100.0, help="side of the coordinate square")
+    parser.add_argument("--metric", choices=["euclidean", "perturbed"], default="euclidean")
+    parser.add_argument("--detour", type=float, default=0.3, help="max detour factor for --metric perturbed")
+    parser.add_argument("--demand", choices=["uniform", "lognormal", "bimodal"], default="uniform")
+    parser.add_argument("--route-size", type=float, default=3.6,
+                        help="average customers per vehicle; lower means tighter capacity")
+    parser.add_argument("--binary", action="store_true", help="also write the .in.bin sidecar")
+    args = parser.parse_args(argv)
+
+    options = dict(seed=args.seed, layout=args.layout, clusters=args.clusters, size=args.size, metric=args.metric,
+                   detour=args.detour, distribution=args.demand, route_size=args.route_size)
+    if args.output is None:
+        if args.binary:
+            parser.error("--binary needs --output")
+        write_stream(sys.stdout.buffer, args.n, **options)
+        return 0
+
+    write_instance(args.output, args.n, binary=args.binary, **options)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
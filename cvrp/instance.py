@@ -0,0 +1,97 @@
+"""
+Bulk instance loader shared by every solver script.
+
+An instance is the usual .in layout:
+
+    n                   number of locations (including depot)
+    Q                   vehicle capacity
+    n rows of n ints    distance matrix
+    n ints              demand vector
+
+The whole input is read in one call and parsed by NumPy in C, instead of
+one readline() + map(int, ...) per matrix row.
+"""
+
+import os
+import stat
+import sys
+
+import numpy as np
+
+from cvrp.cache import load_cached
+
+def _source_path(source):
+    """Returns the file path behind a source, or None for pipes and other streams."""
+    if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+        return os.fsdecode(source)
+    try:
+        fd = source.fileno()
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            return None
+        path = os.path.realpath(f"/proc/self/fd/{fd}")  # stdin redirected from a file (Linux)
+        return path if os.path.isfile(path) else None
+    except (AttributeError, OSError, ValueError):
+        return None
+
+def _read_bytes(source):
+    """Reads the whole source (path or file object) into memory."""
+    if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+        with open(source, "rb") as f:
+            return f.read()
+    stream = getattr(source, "buffer", source)  # Prefer the binary layer of text streams
+    data = stream.read()
+    return data.encode() if isinstance(data, str) else data
+
+def parse_instance(data):
+    """Parses the text of an instance and returns n, Q, D (int32 n x n array) and q (int32 array)."""
+    if isinstance(data, bytes):
+        data = data.decode("ascii")
+    values = np.fromstring(data, dtype=np.int64, sep=" ")
+
+    if values.size < 2:
+        raise ValueError("instance is missing the n / Q header")
+    n, Q = int(values[0]), int(values[1])
+    if n < 1:
+        raise ValueError(f"instance has n={n}, expected at least the depot")
+
+    expected = 2 + n * n + n
+    if values.size != expected:
+        raise ValueError(f"instance with n={n} should hold {expected} integers, found {values.size}")
+
+    body = values[2:]
+    if body.size and (body.min() < np.iinfo(np.int32).min or body.max() > np.iinfo(np.int32).max):
+        raise ValueError("instance values do not fit in int32")
+
+    D = body[:n * n].astype(np.int32).reshape(n, n)     # Contiguous distance matrix
+    q = body[n * n:].astype(np.int32)                   # Demand vector
+    return n, Q, D, q
+
+def load_instance(source=None, cache=None):
+    """Loads an instance from a path, file object or stdin as NumPy arrays.
+
+    This is the entry point for solvers that work on arrays: with a cached
+    .in file, D and q are read-only memmaps of the sidecar, so their pages
+    come from the page cache and are shared between processes. Instances
+    backed by a real .in file go through the binary sidecar cache (see
+    cvrp.cache) unless cache=False or CVRP_CACHE=0 is set.
+    """
+    if source is None:
+        source = sys.stdin
+    if cache is None:
+        cache = os.environ.get("CVRP_CACHE", "1") != "0"
+
+    path = _source_path(source) if cache else None
+    data = _read_bytes(source)
+    if path is not None and path.endswith(".in"):
+        return load_cached(path, data, parse_instance)
+    return parse_instance(data)
+
+def read_input(source=None):
+    """Reads input from stdin and returns number of locations, vehicle capacity, distance matrix, and demand vector."""
+    # Solvers below index D[i][j] one element at a time, which is much faster on
+    # nested lists than on an ndarray, so hand them plain lists built in one pass.
+    # The copy is private to the process (about 8 bytes per entry) and gives up
+    # the memmap's shared pages; solvers that can work on arrays call
+    # load_instance() instead (registered with arrays=True).
+    n, Q, D, q = load_instance(source)
+    return n, Q, D.tolist(), q.tolist()
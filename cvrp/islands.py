@@ -0,0 +1,147 @@
+"""
+Island-model giant-tour GA across worker processes.
+
+Each island is an independent cvrp.tour_ga population. Islands evolve for an
+epoch in parallel on a process pool, then the best individuals of every
+island migrate to the next one in a ring, replacing its worst. D goes into
+shared memory once and every worker decodes straight from the mapped
+ndarray: Split gathers the tour's depot distances and edges in one pass,
+and 2-opt works on each route's own small submatrix, so no worker holds a
+copy of D however large the instance.
+
+With islands=1 there is one population instead, and its children are
+decoded (Split + 2-opt) in batches spread over the workers.
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from cvrp.shared import attach_array, release, share_array
+from cvrp.tour_ga import decode, evolve, initial_population, mutate, order_crossover, tournament
+
+_worker = {}    # Per-process state set up by _init_worker()
+
+def _init_worker(spec, n, Q, q):
+    shm, D = attach_array(spec)     # Mapped for the worker's lifetime, never copied
+    _worker.update(shm=shm, n=n, D=D, Q=Q, q=q, memo={})
+
+def _seed_island(size, seed):
+    w = _worker
+    return initial_population(w["n"], w["Q"], w["D"], w["q"], size, random.Random(seed), w["memo"])
+
+def _evolve_island(population, iterations, mutation_prob, seed, seconds_left):
+    w = _worker
+    if len(population) < 2:
+        return population   # Clones were dropped from a tiny instance, there is nothing to cross
+    deadline = None if seconds_left is None else time.perf_counter() + seconds_left
+    return evolve(population, w["Q"], w["D"], w["q"], iterations, mutation_prob, w["memo"], deadline, random.Random(seed))
+
+def _decode_batch(tours):
+    w = _worker
+    return [decode(tour, w["Q"], w["D"], w["q"], w["memo"]) for tour in tours]
+
+def migrate(islands, migrants):
+    """Copies each island's `migrants` best individuals over the worst of the next island in the ring."""
+    elites = [sorted(population, key=lambda individual: individual[0])[:migrants] for population in islands]
+    for i, population in enumerate(islands):
+        costs = {individual[0] for individual in population}
+        for individual in elites[i - 1]:
+            if individual[0] in costs:
+                continue    # Already there, would only be a clone
+            worst = max(range(len(population)), key=lambda k: population[k][0])
+            if individual[0] < population[worst][0]:
+                costs.discard(population[worst][0])
+                costs.add(individual[0])
+                population[worst] = individual
+
+def run_islands(pool, islands, population_size, epochs, iterations, mutation_prob, migrants, deadline, rng):
+    """Evolves `islands` populations for `epochs` epochs with ring migration; returns all populations."""
+    seeds = [rng.randrange(2 ** 32) for _ in range(islands)]
+    populations = list(pool.map(_seed_island, [population_size] * islands, seeds))
+    for _ in range(epochs):
+        seconds_left = None if deadline is None else deadline - time.perf_counter()
+        if seconds_left is not None and seconds_left <= 0:
+            break
+        seeds = [rng.randrange(2 ** 32) for _ in range(islands)]
+        populations = list(pool.map(_evolve_island, populations, [iterations] * islands,
+                                    [mutation_prob] * islands, seeds, [seconds_left] * islands))
+        migrate(populations, migrants)
+    return populations
+
+def run_batched(pool, workers, population_size, epochs, iterations, mutation_prob, batch_size, deadline, rng):
+    """Steady-state GA on one population whose children are decoded `batch_size` at a time on the pool."""
+    population = next(iter(pool.map(_seed_island, [population_size], [rng.randrange(2 ** 32)])))
+    costs = {individual[0] for individual in population}
+    chunk = max(1, batch_size // workers)
+
+    if len(population) < 2:
+        return [population]     # Nothing to cross, as in tour_ga.solve_cvrp
+    for _ in range(epochs * iterations // batch_size):
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        # Parents for the whole batch come from the population as it stands before the batch
+        children = []
+        for _ in range(batch_size):
+            child = order_crossover(tournament(population, rng)[1], tournament(population, rng)[1], rng)
+            if rng.random() < mutation_prob:
+                mutate(child, rng)
+            children.append(child)
+
+        batches = [children[i:i + chunk] for i in range(0, len(children), chunk)]
+        for decoded in pool.map(_decode_batch, batches):
+            for individual in decoded:
+                if individual[0] in costs:
+                    continue
+                worst = max(range(len(population)), key=lambda k: population[k][0])
+                if individual[0] < population[worst][0]:
+                    costs.discard(population[worst][0])
+                    costs.add(individual[0])
+                    population[worst] = individual
+    return [population]
+
+class _InlinePool:
+    """Runs the worker functions in this process, for workers=1."""
+
+    def __init__(self, D, n, Q, q):
+        _worker.update(n=n, D=D.tolist() if isinstance(D, np.ndarray) else D, Q=Q, q=q, memo={})
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+def solve_cvrp(n, Q, D, q, islands=None, population_size=30, epochs=10, iterations=300, mutation_prob=0.2,
+               migrants=2, workers=None, batch_size=64, time_limit=None):
+    """Solves the CVRP with an island-model giant-tour GA; `iterations` children per island per epoch."""
+    if n <= 1:
+        return []
+    workers = workers or os.cpu_count() or 1
+    islands = islands or workers
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    rng = random.Random(random.getrandbits(64))     # Governed by the global seed
+    q = list(q)
+
+    shm = None
+    if workers <= 1:
+        pool = _InlinePool(D, n, Q, q)
+    else:
+        shm, spec = share_array(np.asarray(D))
+        # Islands evolve one per process; a single population spreads its batches over all workers
+        processes = min(workers, islands) if islands > 1 else workers
+        pool = ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(spec, n, Q, q))
+    try:
+        if islands > 1:
+            populations = run_islands(pool, islands, population_size, epochs, iterations,
+                                      mutation_prob, migrants, deadline, rng)
+        else:
+            populations = run_batched(pool, workers, population_size, epochs, iterations,
+                                      mutation_prob, batch_size, deadline, rng)
+    finally:
+        if shm is not None:
+            pool.shutdown()
+            release(shm)
+
+    return min((individual for population in populations for individual in population),
+               key=lambda individual: individual[0])[2]
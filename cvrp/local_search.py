@@ -0,0 +1,211 @@
+"""
+Intra-route local search operators.
+
+Routes are plain lists that start and end at the depot and are modified in
+place. Moves are evaluated from the edges they remove and add, which
+assumes a symmetric distance matrix (true for every shipped instance).
+"""
+
+from collections import deque
+
+import numpy as np
+
+def _reverse(route, pos, i, j):
+    """Reverses route[i..j] in place and refreshes the positions of the moved customers."""
+    route[i:j + 1] = route[i:j + 1][::-1]
+    for k in range(i, j + 1):
+        pos[route[k]] = k
+
+def _candidate_moves(route, pos, x, p, last_edge, neighbors):
+    """Yields the 2-opt moves (e1, e2) that would create a short edge from x to one of its neighbours."""
+    for y in neighbors[x]:
+        # The depot sits at both ends of the route
+        if y == 0:
+            ys = (0, last_edge + 1)
+        elif y in pos:
+            ys = (pos[y],)
+        else:
+            continue
+        for py in ys:
+            # New edge (x, y) is either (route[e1], route[e2]) or (route[e1 + 1], route[e2 + 1])
+            for e, f in ((p, py), (p - 1, py - 1)):
+                if e > f:
+                    e, f = f, e
+                if e >= 0 and f <= last_edge and f - e >= 2:
+                    yield e, f
+
+def two_opt(route, D, mode="first", neighbors=None):
+    """Improves a route with 2-opt until no improving move remains.
+
+    Each move removes edges (route[e1], route[e1 + 1]) and (route[e2], route[e2 + 1])
+    and reverses the segment between them; its cost change is four lookups.
+
+    mode="first" applies the first improving move found around a customer,
+    mode="best" applies the best one. A don't-look-bit queue holds the
+    customers worth re-examining: initially all of them, afterwards only the
+    endpoints of edges that a move has just changed.
+
+    With neighbors (see cvrp.neighbors) only moves that connect a customer to
+    one of its k nearest locations are tried, so a pass is O(n * k) instead
+    of O(n^2). The result is then a local optimum for that restricted
+    neighbourhood.
+    """
+    if mode not in ("first", "best"):
+        raise ValueError(f"unknown 2-opt mode {mode!r}")
+    last_edge = len(route) - 2          # Edges are 0 .. len(route) - 2
+    if last_edge < 2:
+        return route
+
+    pos = {route[k]: k for k in range(1, len(route) - 1)}
+    queue = deque(route[1:-1])
+    queued = set(queue)
+
+    while queue:
+        x = queue.popleft()
+        queued.discard(x)
+        p = pos[x]
+
+        if neighbors is None:
+            # The customer's two edges are p - 1 (into x) and p (out of x); pair each with every other edge
+            moves = ((e, f) if e < f else (f, e)
+                     for e in (p - 1, p) for f in range(last_edge + 1) if not -1 <= f - e <= 1)
+        else:
+            moves = _candidate_moves(route, pos, x, p, last_edge, neighbors)
+
+        best_delta, best_move = 0, None
+        for e1, e2 in moves:
+            a, b, c, d = route[e1], route[e1 + 1], route[e2], route[e2 + 1]
+            delta = D[a][c] + D[b][d] - D[a][b] - D[c][d]
+            if delta < best_delta:
+                best_delta, best_move = delta, (e1, e2)
+                if mode == "first":
+                    break
+
+        if best_move is None:
+            continue    # Don't-look bit stays set until a neighbouring edge changes
+
+        e1, e2 = best_move
+        _reverse(route, pos, e1 + 1, e2)
+        for node in (route[e1], route[e1 + 1], route[e2], route[e2 + 1]):
+            if node != 0 and node not in queued:
+                queue.append(node)
+                queued.add(node)
+
+    return route
+
+def two_opt_submatrix(route, D):
+    """Returns two_opt() of a route on the ndarray D, looking up only the route's own rows and columns.
+
+    The route's locations are copied out of D as a small nested-list matrix
+    (fast scalar lookups) and the result is mapped back, so D itself is
+    never converted to lists.
+    """
+    if len(route) < 5:
+        return route
+    nodes = route[:-1]                              # Depot plus customers in route order
+    sub = D[np.ix_(nodes, nodes)].tolist()
+    local = two_opt(list(range(len(nodes))) + [0], sub)
+    return [nodes[i] for i in local]
+
+def _insertion_edges(route, pos, ends, last_edge, neighbors):
+    """Returns the edges k = (route[k], route[k + 1]) worth trying as an insertion point."""
+    if neighbors is None:
+        return range(last_edge + 1)
+    edges = set()
+    for x in ends:
+        for y in neighbors[x]:
+            if y == 0:
+                edges.update((0, last_edge))
+            elif y in pos:
+                edges.update((pos[y] - 1, pos[y]))
+    return edges
+
+def or_opt(route, D, max_segment=3, neighbors=None):
+    """Improves a route by relocating segments of up to max_segment customers, optionally reversed.
+
+    Moving route[i..j] between route[k] and route[k + 1] is the 3-opt
+    reconnection that keeps all three pieces in order; with the reversal
+    it also covers the case that flips the moved piece. Each candidate is
+    scored from the three removed and three added edges, without building
+    a new route. With neighbors only insertion points next to one of the
+    segment ends' nearest locations are tried.
+    """
+    last_edge = len(route) - 2
+    if last_edge < 2:
+        return route
+
+    pos = {route[k]: k for k in range(1, len(route) - 1)}
+    queue = deque(route[1:-1])
+    queued = set(queue)
+    moved = False
+
+    while queue or moved:
+        if not queue:
+            # New edges may have opened insertion points for segments nobody re-examined
+            queue.extend(route[1:-1])
+            queued.update(queue)
+            moved = False
+        x = queue.popleft()
+        queued.discard(x)
+
+        best_delta, best_move = 0, None
+        i = pos[x]
+        for j in range(i, min(i + max_segment, last_edge + 1)):
+            if route[j] == 0:
+                break
+            a, s0, sl, b = route[i - 1], route[i], route[j], route[j + 1]
+            removed = D[a][s0] + D[sl][b] - D[a][b]
+
+            for k in _insertion_edges(route, pos, (s0, sl), last_edge, neighbors):
+                if i - 1 <= k <= j:
+                    continue
+                c, d = route[k], route[k + 1]
+                d_cd = D[c][d]
+                forward = D[c][s0] + D[sl][d] - d_cd - removed
+                backward = D[c][sl] + D[s0][d] - d_cd - removed
+                if forward < best_delta:
+                    best_delta, best_move = forward, (i, j, k, False)
+                if backward < best_delta:
+                    best_delta, best_move = backward, (i, j, k, True)
+
+        if best_move is None:
+            continue
+
+        i, j, k, flip = best_move
+        segment = route[i:j + 1]
+        if flip:
+            segment.reverse()
+        touched = {route[i - 1], route[j + 1], route[k], route[k + 1], segment[0], segment[-1]}
+
+        del route[i:j + 1]
+        at = k + 1 if k < i else k + 1 - len(segment)     # Insertion index after the deletion
+        route[at:at] = segment
+        for idx in range(min(i, at), max(j, at + len(segment) - 1) + 1):
+            pos[route[idx]] = idx
+
+        moved = True
+
+        # Segments that start up to max_segment - 1 places before a changed edge have new costs too
+        for node in touched:
+            if node == 0:
+                continue
+            for idx in range(max(1, pos[node] - max_segment + 1), pos[node] + 1):
+                if route[idx] not in queued:
+                    queue.append(route[idx])
+                    queued.add(route[idx])
+
+    return route
+
+def three_opt(route, D, max_segment=3, neighbors=None):
+    """Alternates 2-opt and Or-opt until neither improves the route.
+
+    Together they cover the 3-opt reconnections in which one of the
+    rearranged pieces has at most max_segment customers, at O(n) moves per
+    customer instead of enumerating every (i, j, k) triple.
+    """
+    while True:
+        before = route[:]
+        two_opt(route, D, neighbors=neighbors)
+        or_opt(route, D, max_segment, neighbors)
+        if route == before:
+            return route
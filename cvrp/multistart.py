@@ -0,0 +1,62 @@
+"""
+Parallel multi-start Clarke-Wright.
+
+Each start merges routes in the order of a parameterised saving
+s = D[0][i] + D[0][j] - lam * D[i][j], scaled by a little random noise, then
+polishes every route with two_opt(). Starts run on a process pool; D is put
+in shared memory once and every worker maps it read-only. Start 0 is always
+the plain lam=1, noise=0 savings order.
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from cvrp.local_search import two_opt_submatrix
+from cvrp.savings import iter_pairs, merge_routes, perturbed_savings_pairs
+from cvrp.shared import attach_array, release, share_array
+
+_worker = {}    # Per-process state set up by _init_worker()
+
+def _init_worker(spec, Q, q, k):
+    shm, D = attach_array(spec)
+    _worker.update(shm=shm, D=D, Q=Q, q=q, k=k)
+
+def run_start(D, Q, q, lam, noise, seed, k=None):
+    """Builds and polishes one solution; returns (cost, routes)."""
+    _, rows, cols = perturbed_savings_pairs(D, lam, noise, seed, k)
+    routes = [two_opt_submatrix(route, D) for route in merge_routes(D.shape[0], Q, q, iter_pairs(rows, cols))]
+    cost = sum(int(D[route[:-1], route[1:]].sum()) for route in routes)
+    return cost, routes
+
+def _run_start_in_worker(params):
+    lam, noise, seed = params
+    return run_start(_worker["D"], _worker["Q"], _worker["q"], lam, noise, seed, _worker["k"])
+
+def start_parameters(starts, rng, lam_range=(0.6, 1.6), noise=0.1):
+    """Returns (lam, noise, seed) for each start; the first is the plain savings order."""
+    params = [(1.0, 0.0, 0)]
+    for _ in range(starts - 1):
+        params.append((rng.uniform(*lam_range), rng.uniform(0, noise), rng.randrange(2 ** 32)))
+    return params
+
+def solve_cvrp(n, Q, D, q, starts=32, workers=None, noise=0.1, k=None):
+    """Solves the CVRP with `starts` randomised Clarke-Wright + 2-opt runs spread over `workers` processes."""
+    D = np.asarray(D)
+    q = list(q)
+    params = start_parameters(starts, random.Random(random.getrandbits(64)), noise=noise)
+    workers = min(workers or os.cpu_count() or 1, len(params))
+
+    if workers <= 1:
+        results = [run_start(D, Q, q, *p, k=k) for p in params]
+    else:
+        shm, spec = share_array(D)
+        try:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(spec, Q, q, k)) as pool:
+                results = list(pool.map(_run_start_in_worker, params))
+        finally:
+            release(shm)
+
+    return min(results, key=lambda result: result[0])[1]
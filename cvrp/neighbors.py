@@ -0,0 +1,42 @@
+"""
+k-nearest-neighbour candidate lists.
+
+Local search and perturbation operators use these to only try moves that
+create a short edge (x, y) with y among x's k closest locations, instead of
+scanning every position in a route.
+"""
+
+import numpy as np
+
+BLOCK_ROWS = 1024
+
+def nearest_neighbors(D, k=10):
+    """Returns an (n, k) int32 array whose row i lists the k locations closest to i, nearest first.
+
+    Location i itself is never in its own list; the depot (0) can be. Equal
+    distances are listed in index order. Rows are processed in blocks with
+    np.argpartition, so the cost is O(n^2) with only O(BLOCK_ROWS * n) extra
+    memory.
+    """
+    D = np.asarray(D)
+    n = D.shape[0]
+    k = min(k, n - 1)
+    result = np.empty((n, max(k, 0)), dtype=np.int32)
+    if k <= 0:
+        return result
+
+    for start in range(0, n, BLOCK_ROWS):
+        stop = min(n, start + BLOCK_ROWS)
+        # Rank by distance * n + index, so equal distances are broken by index even across the partition point
+        block = D[start:stop].astype(np.int64) * n + np.arange(n)
+        rows = np.arange(stop - start)
+        block[rows, rows + start] = np.iinfo(np.int64).max   # Exclude self
+
+        candidates = np.argpartition(block, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(block, candidates, axis=1), axis=1)
+        result[start:stop] = np.take_along_axis(candidates, order, axis=1)
+    return result
+
+def neighbor_lists(D, k=10):
+    """Same as nearest_neighbors() but as nested Python lists for use in pure-Python loops."""
+    return nearest_neighbors(D, k).tolist()
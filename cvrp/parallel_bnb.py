@@ -0,0 +1,187 @@
+"""
+Parallel depth-first branch and bound across worker processes.
+
+The children of the root (see cvrp.bnb) are the first tasks on a shared
+queue. Each worker takes a task, runs cvrp.bnb's depth-first search below
+it and returns the best solution it reached. Three counters live in
+shared memory:
+
+- the incumbent cost, which every worker prunes with and lowers as soon as
+  it finds something better;
+- the number of idle workers; while it is non-zero, a busy worker gives
+  away the later half of the children in its shallowest stack frame as new
+  tasks, so the tree is rebalanced without any central scheduler;
+- the number of unfinished tasks; the search is over when it reaches zero.
+
+Workers on the route-level tree only need its route costs and prices,
+passed to each worker once at start-up. Workers on the customer-level tree
+index D as a read-only ndarray in shared memory (see cvrp.shared), so the
+matrix exists once however many workers run; the parent keeps the nested
+lists it was given for its own enumeration and bounding.
+"""
+
+import math
+import multiprocessing
+import os
+import queue
+import time
+
+import numpy as np
+
+from cvrp.bnb import (EPS, ROUTE_LIMIT, _customer_tree, _depth_first, _route_tree, _routes_from_steps,
+                      dual_prices, incumbent)
+from cvrp.shared import attach_array, release, share_array
+from cvrp.subsets import RouteCache, route_costs
+
+BEST, PENDING, IDLE = range(3)      # Slots of the shared counters
+
+def _make_tree(n, Q, D, q, costs, prices):
+    if costs is not None:
+        return _route_tree(n, costs, prices)
+    return _customer_tree(n, Q, D, q)
+
+def _donate(stack, path, prefix, best_cost, tasks, counters, lock):
+    """Moves the later half of the shallowest frame with spare children onto the task queue."""
+    for depth, frame in enumerate(stack):
+        children, index = frame[0], frame[1]
+        keep = index + (len(children) - index + 1) // 2
+        given = [child for child in children[keep:] if child[0] + EPS < best_cost]
+        if not given:
+            continue
+        frame[0] = children[:keep]
+        with lock:
+            counters[PENDING] += len(given)     # Before the tasks are visible, so PENDING never hits 0 early
+        for child in given:
+            tasks.put((prefix + path[:depth], child))
+        return
+
+def _worker(spec, counters_spec, n, Q, q, costs, prices, seconds_left, tasks, results, lock):
+    D = None
+    if spec is not None:
+        shm, D = attach_array(spec)     # Mapped for the worker's lifetime, never copied
+    counters_shm, counters = attach_array(counters_spec, writable=True)
+    _, _, expand = _make_tree(n, Q, D, q, costs, prices)
+    deadline = None if seconds_left is None else time.perf_counter() + seconds_left
+    prefix = []
+
+    def poll(best_cost, stack, path, skipped):
+        if best_cost < counters[BEST]:
+            with lock:
+                counters[BEST] = min(counters[BEST], best_cost)
+        if counters[IDLE] > 0:
+            _donate(stack, path, prefix, best_cost, tasks, counters, lock)
+        return min(best_cost, int(counters[BEST]))
+
+    while True:
+        with lock:
+            counters[IDLE] += 1
+        task = tasks.get()
+        with lock:
+            counters[IDLE] -= 1
+        if task is None:
+            break
+
+        prefix, (child_lb, child_cost, state, step, complete) = task
+        prefix = prefix + [step]
+        best_cost = int(counters[BEST])
+        found, open_bound = None, math.inf
+        if child_lb + EPS >= best_cost:
+            pass
+        elif deadline is not None and time.perf_counter() > deadline:
+            open_bound = child_lb
+        elif complete:
+            found = (int(child_cost), prefix)
+        else:
+            best_cost, found, skipped, finished = _depth_first(state, expand, best_cost, deadline=deadline, poll=poll)
+            if found is not None:
+                found = (int(found[0]), prefix + found[1])
+            if not finished:
+                open_bound = skipped
+
+        if found is not None:
+            with lock:
+                counters[BEST] = min(counters[BEST], found[0])
+        results.put((found, open_bound))
+        with lock:
+            counters[PENDING] -= 1
+
+    results.put(None)   # Sent after every result of this worker
+
+def parallel_depth_first(n, Q, D, q, workers=None, time_limit=None, initial=None, route_limit=ROUTE_LIMIT,
+                         cache=None):
+    """Returns (cost, routes, lower_bound) by depth-first branch and bound on `workers` processes.
+
+    lower_bound equals cost when the search finished; otherwise it is the
+    least bound over the tasks that were cut short. Raises RuntimeError if a
+    worker process dies, after stopping the others.
+    """
+    start = time.perf_counter()
+    if n <= 1:
+        return 0, [], 0
+    if not isinstance(D, list):
+        D = np.asarray(D).tolist()      # Scalar lookups in the parent's enumeration and bounds
+    if cache is None:
+        cache = RouteCache(D)
+    enumerated = route_costs(n, Q, D, q, route_limit, cache)
+    if initial is None:
+        initial = incumbent(n, Q, D, q, cache=cache)
+    best_cost, best_routes = initial
+
+    costs, prices = (enumerated[0], dual_prices(n, *enumerated, q)) if enumerated is not None else (None, None)
+    root, lower, expand = _make_tree(n, Q, D, q, costs, prices)
+    first_tasks = [child for child in expand(root, best_cost) if child[0] + EPS < best_cost]
+    if not first_tasks:
+        return best_cost, best_routes, best_cost
+
+    workers = workers or os.cpu_count() or 1
+    shm, spec = share_array(np.asarray(D)) if costs is None else (None, None)
+    counters_shm, counters_spec = share_array(np.array([best_cost, len(first_tasks), 0], dtype=np.int64))
+    view_shm, counters = attach_array(counters_spec, writable=True)
+    tasks, results, lock = multiprocessing.Queue(), multiprocessing.Queue(), multiprocessing.Lock()
+    seconds_left = None if time_limit is None else time_limit - (time.perf_counter() - start)
+    processes = [multiprocessing.Process(target=_worker, args=(spec, counters_spec, n, Q, list(q), costs, prices,
+                                                               seconds_left, tasks, results, lock))
+                 for _ in range(workers)]
+    try:
+        for child in first_tasks:
+            tasks.put(([], child))
+        for process in processes:
+            process.start()
+
+        best_steps, open_bound, stopping, running = None, math.inf, False, workers
+        while running:
+            if not stopping and counters[PENDING] == 0:
+                for _ in processes:
+                    tasks.put(None)
+                stopping = True
+            try:
+                message = results.get(timeout=0.05)
+            except queue.Empty:
+                # A worker that died (killed, out of memory, an exception) never sends its final None
+                failed = [process for process in processes if process.exitcode not in (None, 0)]
+                if failed:
+                    for process in processes:
+                        process.terminate()
+                        process.join()
+                    tasks.cancel_join_thread()      # Undelivered tasks must not block this process's exit
+                    raise RuntimeError(f"branch and bound worker exited with code {failed[0].exitcode}")
+                continue
+            if message is None:
+                running -= 1
+                continue
+            found, task_bound = message
+            open_bound = min(open_bound, task_bound)
+            if found is not None and found[0] < best_cost:
+                best_cost, best_steps = found
+        for process in processes:
+            process.join()
+    finally:
+        del counters
+        view_shm.close()
+        release(counters_shm)
+        if shm is not None:
+            release(shm)
+
+    if best_steps is not None:
+        best_routes = _routes_from_steps(best_steps, costs is not None, cache)
+    return best_cost, best_routes, min(best_cost, max(lower, open_bound))
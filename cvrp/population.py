@@ -0,0 +1,156 @@
+"""
+Diverse starting solutions for the genetic algorithms.
+
+Calling the deterministic greedy once per individual costs O(n^2) every
+time and only yields identical copies. Here one neighbour index and a few
+O(n) arrays are built up front and shared by four cheap randomised
+constructions, used in turn:
+
+- randomised greedy: the next customer is drawn from the first `rcl`
+  feasible unvisited neighbours of the current one (a restricted candidate
+  list) instead of always taking the nearest;
+- sweep: customers ordered by angle around the depot, from a random start
+  angle and direction, and cut into routes by Split;
+- perturbed savings: Clarke-Wright over the k-nearest-neighbour pairs with
+  a random lam and noise, as in cvrp.multistart;
+- random giant tours cut into routes by Split.
+
+The first individual is always the plain greedy solution. D is expected as
+nested lists (Split and the greedy do scalar lookups); it is converted to an
+array once for the vectorised parts.
+"""
+
+import math
+import random
+
+import numpy as np
+
+from cvrp.neighbors import nearest_neighbors
+from cvrp.routes import initial_solution
+from cvrp.savings import candidate_pairs, iter_pairs, merge_routes
+from cvrp.split import split
+
+def polar_angles(D):
+    """Returns every location's angle around the depot in a planar embedding rebuilt from three rows of D.
+
+    Instances only carry distances, so the depot is put at the origin and
+    the customer farthest from it on the x axis; each location's x and |y|
+    follow from its distances to those two, and a third reference point
+    (the one farthest off the axis) decides the sign of y.
+    """
+    d0 = np.asarray(D[0], dtype=np.float64)
+    a = int(np.argmax(d0))
+    if d0[a] == 0:
+        return np.zeros(len(d0))
+    da = np.asarray(D[a], dtype=np.float64)
+    x = (d0 ** 2 - da ** 2 + d0[a] ** 2) / (2 * d0[a])
+    y = np.sqrt(np.maximum(d0 ** 2 - x ** 2, 0))
+
+    b = int(np.argmax(y))
+    db2 = np.asarray(D[b], dtype=np.float64) ** 2
+    above = (x - x[b]) ** 2 + (y - y[b]) ** 2
+    below = (x - x[b]) ** 2 + (y + y[b]) ** 2
+    y = np.where(np.abs(below - db2) < np.abs(above - db2), -y, y)
+    return np.arctan2(y, x)
+
+def randomized_greedy(n, Q, q, neighbors, rng=random, rcl=3):
+    """Nearest-neighbour construction that picks among the `rcl` nearest feasible customers at random."""
+    visited = [False] * n
+    visited[0] = True
+    head = [0] * n                  # neighbors[x][:head[x]] are all visited
+    pool = list(range(1, n))        # Unvisited customers, removed by swapping with the last entry
+    where = list(range(-1, n - 1))  # where[c] = index of c in pool
+    smallest = min(q[1:], default=0)
+
+    routes = []
+    while pool:
+        route = [0]
+        capacity = Q
+        current = 0
+
+        while pool:
+            row = neighbors[current]
+            h = head[current]
+            while h < len(row) and visited[row[h]]:
+                h += 1
+            head[current] = h
+
+            options = []
+            for i in range(h, len(row)):
+                c = row[i]
+                if not visited[c] and q[c] <= capacity:
+                    options.append(c)
+                    if len(options) == rcl:
+                        break
+
+            if options:
+                next_customer = rng.choice(options)
+            elif smallest > capacity:
+                break       # Nothing can fit, return to depot
+            else:
+                # No listed neighbour fits: jump to a random remaining customer that does, or give up on this route
+                for _ in range(8):
+                    next_customer = pool[rng.randrange(len(pool))]
+                    if q[next_customer] <= capacity:
+                        break
+                else:
+                    if len(route) > 1:
+                        break
+                    next_customer = min(pool, key=q.__getitem__)  # Empty route: take the smallest, it always fits
+
+            route.append(next_customer)
+            capacity -= q[next_customer]
+            current = next_customer
+            visited[next_customer] = True
+            i, last = where[next_customer], pool[-1]
+            pool[i], where[last] = last, i
+            pool.pop()
+
+        if len(route) == 1:
+            raise ValueError(f"remaining customers exceed capacity {Q}")
+        route.append(0)
+        routes.append(route)
+    return routes
+
+def sweep_tour(angles, rng=random):
+    """Customers by angle around the depot, starting at a random angle in a random direction."""
+    start = rng.uniform(-math.pi, math.pi)
+    order = np.argsort((angles[1:] - start) % (2 * math.pi), kind="stable") + 1
+    tour = order.tolist()
+    if rng.random() < 0.5:
+        tour.reverse()
+    return tour
+
+def perturbed_savings(n, Q, q, pairs, rng=random, lam_range=(0.6, 1.6), noise=0.1):
+    """Clarke-Wright merge over precomputed (rows, cols, d0i + d0j, dij) pairs with a random lam and noise."""
+    rows, cols, depot_sum, dij = pairs
+    s = depot_sum - rng.uniform(*lam_range) * dij
+    s *= np.random.default_rng(rng.randrange(2 ** 32)).uniform(1 - noise, 1 + noise, len(s))
+    order = np.argsort(-s, kind="stable")
+    return merge_routes(n, Q, q, iter_pairs(rows[order], cols[order]))
+
+def diverse_population(n, Q, D, q, size, rng=random, k=30):
+    """Returns `size` route sets: the greedy solution, then randomised greedy, sweep, savings and random-tour seeds in turn."""
+    D_array = np.asarray(D)
+    near = nearest_neighbors(D_array, k)
+    neighbors = near.tolist()
+    angles = polar_angles(D_array)
+    rows, cols = candidate_pairs(D_array, neighbors=near)
+    depot = D_array[0].astype(np.float64)
+    pairs = (rows, cols, depot[rows] + depot[cols], D_array[rows, cols].astype(np.float64))
+
+    def random_tour():
+        tour = list(range(1, n))
+        rng.shuffle(tour)
+        return split(tour, Q, D, q)[1]
+
+    builders = [
+        lambda: randomized_greedy(n, Q, q, neighbors, rng),
+        lambda: split(sweep_tour(angles, rng), Q, D, q)[1],
+        lambda: perturbed_savings(n, Q, q, pairs, rng),
+        random_tour,
+    ]
+    population = [initial_solution(n, Q, D_array, q)] if size > 0 else []
+    for i in range(size - 1):
+        population.append(builders[i % len(builders)]())
+    return population
@@ -0,0 +1,82 @@
+"""
+Solver plugin registry.
+
+Each algorithm is registered as "<target>:<function>", where target is
+either one of the standalone scripts in the repository root (e.g.
+"greedy_cvrp.py") or a dotted module path (e.g. "cvrp.routes"). Nothing is
+imported until load_solver() asks for that algorithm, so the CLI only pays
+for the module it actually runs.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOLVERS = {}
+STOCHASTIC = set()  # Solvers whose result depends on the random seed
+ARRAY_INPUT = set() # Solvers that take D as the int32 ndarray rather than nested lists
+
+def register(name, target, stochastic=False, arrays=False):
+    """Registers a solver under `name`; target is "script.py:func" or "package.module:func"."""
+    if ":" not in target:
+        target += ":solve_cvrp"
+    SOLVERS[name] = target
+    if stochastic:
+        STOCHASTIC.add(name)
+    if arrays:
+        ARRAY_INPUT.add(name)
+
+def read_for(name, source=None):
+    """Reads an instance with D in the form the solver `name` works on."""
+    from cvrp.instance import load_instance, read_input
+
+    if name in ARRAY_INPUT:
+        n, Q, D, q = load_instance(source)
+        return n, Q, D, q.tolist()
+    return read_input(source)
+
+def _load_script(filename):
+    """Imports one of the root-level solver scripts (names like 2-Opt.py are not valid modules)."""
+    module_name = "cvrp_script_" + os.path.splitext(filename)[0].replace("-", "_").lower()
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def load_solver(name):
+    """Imports the module behind `name` and returns its solve function."""
+    if name not in SOLVERS:
+        raise KeyError(f"unknown algorithm {name!r}, choose from: {', '.join(SOLVERS)}")
+
+    target, func = SOLVERS[name].rsplit(":", 1)
+    module = _load_script(target) if target.endswith(".py") else importlib.import_module(target)
+    return getattr(module, func)
+
+# Existing solver scripts
+register("greedy", "greedy_cvrp.py", arrays=True)
+register("greedy-pq", "greedy_priority_queue.py", arrays=True)
+register("nn", "nearest_unvisited.py", arrays=True)
+register("cw", "clarkey_wright_savings.py", arrays=True)
+register("cw-union", "clarkey_union.py", arrays=True)
+register("cw-ls", "clarkey_local_search.py")
+register("2opt", "2-Opt.py")
+register("3opt", "3-Opt.py")
+register("sa", "simulated_annealing.py", stochastic=True)
+register("sa2", "simulated_annealing_2.py", stochastic=True)
+register("sa-2opt", "simulated_annealing_2-opt.py", stochastic=True)
+register("ga", "genetic.py", stochastic=True)
+register("bnb", "branch_and_bound.py")
+register("brute", "brute_force.py")
+
+# Package engines
+register("sa-delta", "cvrp.anneal", stochastic=True)
+register("cw-multi", "cvrp.multistart", stochastic=True, arrays=True)
+register("ga-tour", "cvrp.tour_ga", stochastic=True)
+register("ga-islands", "cvrp.islands", stochastic=True, arrays=True)
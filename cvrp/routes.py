@@ -0,0 +1,33 @@
+"""Route evaluators and the solution checker shared by every solver."""
+
+from cvrp.construct import masked_greedy_routes
+
+def calculate_route_distance(route, D):
+    """Calculates total distance of a given route."""
+    return sum(D[a][b] for a, b in zip(route, route[1:]))
+
+def total_distance(routes, D):
+    """Calculates total distance for all routes."""
+    return sum(calculate_route_distance(route, D) for route in routes)
+
+def route_load(route, q):
+    """Returns the total demand served by a route (the depot has no demand)."""
+    return sum(q[i] for i in route if i != 0)
+
+def is_valid_route(route, Q, q):
+    """Check if a route does not exceed the vehicle capacity"""
+    return route_load(route, q) <= Q
+
+def initial_solution(n, Q, D, q):
+    """Creates an initial greedy solution for CVRP (nearest feasible customer first)."""
+    return masked_greedy_routes(n, Q, D, q)
+
+def check(routes, n, Q, D, q):
+    """Checks that every route respects capacity and every location is visited."""
+    node_visited = set()
+    for route in routes:
+        if route_load(route, q) > Q:
+            return False
+        node_visited.update(route)
+
+    return len(node_visited) == len(q)
@@ -0,0 +1,37 @@
+"""
+Read-only NumPy arrays shared with worker processes.
+
+The parent copies an array into a multiprocessing.shared_memory block once
+and hands workers a small picklable spec; each worker maps the same pages
+instead of receiving its own pickled copy of D. Works with both the fork
+and spawn start methods.
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+def share_array(array):
+    """Copies `array` into shared memory and returns (shm, spec); the caller must close and unlink shm."""
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+def attach_array(spec, writable=False):
+    """Maps a shared array from its spec and returns (shm, array); keep shm alive while using array.
+
+    Arrays are read-only unless writable=True; writers must then agree on
+    their own locking.
+    """
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    array.flags.writeable = writable
+    return shm, array
+
+def release(shm):
+    """Closes and removes a block created by share_array()."""
+    shm.close()
+    shm.unlink()
@@ -0,0 +1,80 @@
+"""
+Prins' Split: optimal cutting of a giant tour into capacity-feasible routes.
+
+A giant tour is a permutation of the customers 1..n-1 without depot visits.
+Split finds the cheapest way to cut it into consecutive routes that each
+respect the capacity, as a shortest path over the tour positions. The
+textbook Bellman version tries every feasible route and is O(n * B) for B
+customers per route; this is Vidal's (2016) O(n) version, which keeps the
+only predecessors that can still be optimal in a monotone deque.
+"""
+
+from collections import deque
+
+import numpy as np
+
+def split(tour, Q, D, q):
+    """Returns (cost, routes) for the optimal capacity-feasible cutting of a giant tour.
+
+    D may be nested lists or an ndarray.
+    """
+    m = len(tour)
+    if m == 0:
+        return 0, []
+    node = [0] + list(tour)                 # 1-based tour positions
+    if isinstance(D, np.ndarray):
+        # Only the depot row, the depot column and the tour's own edges are needed: gather them in one pass each
+        d0 = D[0, node].tolist()
+        dx0 = D[node, 0].tolist()
+        step = [0, 0] + D[node[1:-1], node[2:]].tolist()
+    else:
+        d0 = [D[0][c] for c in node]        # Depot -> customer at each position
+        dx0 = [D[c][0] for c in node]       # Customer -> depot
+        step = [0, 0] + [D[node[i - 1]][node[i]] for i in range(2, m + 1)]
+    load = [0] * (m + 1)                    # load[i] = demand of node[1..i]
+    dist = [0] * (m + 2)                    # dist[i] = length of node[1..i] as a path
+    for i in range(1, m + 1):
+        load[i] = load[i - 1] + q[node[i]]
+        if q[node[i]] > Q:
+            raise ValueError(f"customer {node[i]} has demand {q[node[i]]} > capacity {Q}")
+        if i > 1:
+            dist[i] = dist[i - 1] + step[i]
+
+    potential = [0] * (m + 1)               # potential[i] = cheapest cost of serving node[1..i]
+    pred = [0] * (m + 1)
+    # key[i]: cost of leaving the depot for node[i + 1] after position i, minus the path length up to it.
+    # Predecessor i is better than j for every later position iff key[i] < key[j]
+    key = [0] * (m + 1)
+    key[0] = d0[1]
+
+    front = deque([0])
+    for i in range(1, m + 1):
+        best = front[0]
+        potential[i] = key[best] + dist[i] + dx0[i]
+        pred[i] = best
+        if i == m:
+            break
+
+        k = key[i] = potential[i] + d0[i + 1] - dist[i + 1]
+        back = front[-1]
+        # back dominates i only if it is no worse and has room for just as many later customers
+        if not (load[back] == load[i] and key[back] <= k):
+            while front and k <= key[front[-1]]:
+                front.pop()
+            front.append(i)
+        limit = load[i + 1] - Q
+        while load[front[0]] < limit:
+            front.popleft()
+
+    routes = []
+    j = m
+    while j > 0:
+        i = pred[j]
+        routes.append([0] + node[i + 1:j + 1] + [0])
+        j = i
+    routes.reverse()
+    return potential[m], routes
+
+def giant_tour(routes):
+    """Concatenates routes into a giant tour (the customers in visiting order)."""
+    return [c for route in routes for c in route[1:-1]]
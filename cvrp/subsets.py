@@ -0,0 +1,244 @@
+"""
+Held-Karp dynamic programming over customer subsets.
+
+Customer sets are bitmasks over location indices (bit c set = customer c
+visited; bit 0, the depot, is never set). A single-vehicle route serving a
+set S costs at least the shortest Hamiltonian path 0 -> S -> 0, which
+Held-Karp computes in O(2^|S| * |S|^2). Capacity keeps the routes of the
+shipped small instances short (at most 7 customers on 1.in, 10 on 2.in), so
+every feasible subset can be enumerated outright.
+
+best_partition() then splits the customers into such subsets at least total
+cost, which together gives the exact optimum. RouteCache holds one
+instance's enumerated costs and the routes built from them within a memory
+budget, so the exact solvers compute each of them at most once.
+"""
+
+import math
+import sys
+from collections import OrderedDict
+
+CACHE_BYTES = 64 * 2 ** 20      # Default memory budget of a RouteCache
+COST_ENTRY = 80                 # Bytes per enumerated cost (dict slot, mask and cost ints), measured on 2.in
+EPS = 1e-6                      # Slack for the floating-point prices in best_partition()
+ENTRY_OVERHEAD = 150            # Bytes per built route for the ordered-dict node and its (cost, route) tuple
+
+class RouteCache:
+    """Memory-bounded store of one instance's route costs and routes, keyed by customer bitmask.
+
+    route_costs() hands its enumeration over to the cache (costs[mask] and
+    loads[mask], not a copy), and later calls with the same cache return it
+    instead of enumerating again. Routes are built by subset_tour() the
+    first time route() asks for one and kept in least-recently-used order.
+    Both count against max_bytes: the costs are never evicted, since the
+    searches need every one of them, so route_costs() gives up when they
+    would not fit; built routes are evicted to stay within the budget.
+    hits and misses count the lookups of cost() and route().
+    """
+
+    def __init__(self, D, max_bytes=CACHE_BYTES):
+        self.D = D
+        self.max_bytes = max_bytes
+        self.costs = {}
+        self.loads = None       # Set once an enumeration is complete
+        self.routes = OrderedDict()
+        self.size = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self.routes)
+
+    def _route_size(self, mask, route):
+        return ENTRY_OVERHEAD + sys.getsizeof(mask) + sys.getsizeof(route)
+
+    def _evict(self):
+        while self.size > self.max_bytes and self.routes:
+            evicted, (_, route) = self.routes.popitem(last=False)
+            self.size -= self._route_size(evicted, route)
+            self.evictions += 1
+
+    def fits(self, count):
+        """Returns whether `count` enumerated costs fit in the budget (built routes can be evicted for them)."""
+        return count * COST_ENTRY <= self.max_bytes
+
+    def keep(self, costs, loads):
+        """Takes over a complete enumeration from route_costs()."""
+        self.size += (len(costs) - len(self.costs)) * COST_ENTRY
+        self.costs, self.loads = costs, loads
+        self._evict()
+
+    def cost(self, mask):
+        """Returns the cheapest known cost for mask without building its route, or None."""
+        cost = self.costs.get(mask)
+        if cost is None and mask in self.routes:
+            cost = self.routes[mask][0]
+        if cost is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return cost
+
+    def put(self, mask, cost, route):
+        """Stores (cost, route) for mask unless an entry at most as expensive is already there."""
+        old = self.routes.get(mask)
+        if old is not None:
+            if old[0] <= cost:
+                return
+            self.size -= self._route_size(mask, old[1])
+        self.routes[mask] = (cost, route)
+        self.routes.move_to_end(mask)
+        self.size += self._route_size(mask, route)
+        self._evict()
+
+    def route(self, mask):
+        """Returns (cost, route) of the cheapest route for mask, running subset_tour() if it is not cached."""
+        entry = self.routes.get(mask)
+        if entry is not None:
+            self.hits += 1
+            self.routes.move_to_end(mask)
+            return entry
+        self.misses += 1
+        entry = subset_tour(mask, self.D)
+        self.put(mask, *entry)
+        return entry
+
+    def stats(self):
+        """Returns the counters and current size as a dict."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "costs": len(self.costs),
+                "routes": len(self.routes), "bytes": self.size}
+
+def route_costs(n, Q, D, q, limit=None, cache=None):
+    """Returns (costs, loads) for every customer subset that fits in one vehicle.
+
+    costs[mask] is the cheapest route serving exactly those customers and
+    loads[mask] their total demand. Subsets are built level by level, one
+    customer larger each time, keeping best[last] = cheapest path from the
+    depot through the subset ending at `last` for the current level only.
+    Returns None as soon as more than `limit` subsets would be needed, or
+    more than fit in the budget of `cache` (a RouteCache) if one is given.
+    The cache then keeps the result and returns it on later calls.
+    """
+    if cache is not None and cache.loads is not None:
+        if limit is not None and len(cache.costs) > limit:
+            return None
+        return cache.costs, cache.loads
+
+    customers = [c for c in range(1, n) if q[c] <= Q]
+    level = {1 << c: {c: D[0][c]} for c in customers}
+    loads = {1 << c: q[c] for c in customers}
+    costs = {}
+
+    while level:
+        if limit is not None and len(costs) + len(level) > limit:
+            return None
+        if cache is not None and not cache.fits(len(costs) + len(level)):
+            return None
+        following = {}
+        for mask, paths in level.items():
+            costs[mask] = min(cost + D[last][0] for last, cost in paths.items())
+            load = loads[mask]
+            for c in customers:
+                if mask >> c & 1 or load + q[c] > Q:
+                    continue
+                cost = min(path + D[last][c] for last, path in paths.items())
+                child = mask | 1 << c
+                best = following.setdefault(child, {})
+                if cost < best.get(c, cost + 1):
+                    best[c] = cost
+                loads[child] = load + q[c]
+        level = following
+    if cache is not None:
+        cache.keep(costs, loads)
+    return costs, loads
+
+def subset_tour(mask, D):
+    """Returns (cost, route) for the cheapest route serving exactly the customers in mask."""
+    members = [c for c in range(1, mask.bit_length()) if mask >> c & 1]
+    if not members:
+        return 0, [0, 0]
+
+    # best[(subset, last)] = (cost, previous) over subsets of `members` given as bitmasks of their positions
+    best = {(1 << i, i): (D[0][c], None) for i, c in enumerate(members)}
+    for subset in range(1, 1 << len(members)):
+        for i, c in enumerate(members):
+            if (subset, i) not in best:
+                continue
+            cost = best[(subset, i)][0]
+            for j, d in enumerate(members):
+                if subset >> j & 1:
+                    continue
+                key = (subset | 1 << j, j)
+                if key not in best or cost + D[c][d] < best[key][0]:
+                    best[key] = (cost + D[c][d], i)
+
+    everything = (1 << len(members)) - 1
+    cost, last = min((best[(everything, i)][0] + D[c][0], i) for i, c in enumerate(members))
+
+    route, subset = [0], everything
+    while last is not None:
+        route.append(members[last])
+        last, subset = best[(subset, last)][1], subset & ~(1 << last)
+    route.append(0)
+    route.reverse()
+    return cost, route
+
+def best_partition(n, costs, prices=None):
+    """Returns (cost, masks): the cheapest split of all customers into sets that each fit one route.
+
+    part(S) = min(costs[R] + part(S - R)) over the feasible sets R inside S
+    that contain S's lowest customer, so every partition is counted once.
+    It is memoised on S and only evaluated for the sets that remain after
+    removing routes from the full set. Each call gets a budget, the most the
+    rest may cost to beat the best split found above it, and stops as soon
+    as no remaining route can stay under it; a set cut short that way is
+    memoised with the budget as a lower bound instead of its cost.
+
+    prices, if given, must satisfy sum(prices[v] for v in R) <= costs[R]
+    for every route R (cvrp.bnb.dual_prices() computes such prices). Then
+    part(S) >= the prices of S, routes are tried by increasing reduced cost
+    costs[R] - prices of R, and the budget cuts off most of each list; on
+    random 20-customer instances this is what makes the DP finish in well
+    under a second. Returns (math.inf, None) if some customer fits in no
+    route.
+    """
+    if prices is None:
+        prices = [0] * n
+    by_anchor = [[] for _ in range(n)]
+    for mask, cost in costs.items():
+        price = sum(prices[v] for v in range(1, n) if mask >> v & 1)
+        by_anchor[(mask & -mask).bit_length() - 1].append((cost - price, cost, mask, price))
+    for routes in by_anchor:
+        routes.sort()
+
+    # remaining customers -> (cost, route taking the lowest one) if solved, (lower bound, None) if cut short
+    memo = {0: (0, 0)}
+
+    def part(rest, rest_price, budget):
+        known = memo.get(rest)
+        if known is not None and (known[1] is not None or known[0] >= budget):
+            return known[0]
+        best, choice = math.inf, None
+        for reduced, cost, route, price in by_anchor[(rest & -rest).bit_length() - 1]:
+            limit = min(best, budget)
+            if reduced + rest_price + EPS >= limit:
+                break   # This route and every later one cost at least the limit with the rest
+            if route & rest == route:
+                total = cost + part(rest & ~route, rest_price - price, limit - cost)
+                if total < best:
+                    best, choice = total, route
+        if best < budget:
+            memo[rest] = (best, choice)
+            return best
+        memo[rest] = (budget, None)
+        return budget
+
+    full = (1 << n) - 2
+    cost = part(full, sum(prices), math.inf)
+    if cost == math.inf:
+        return cost, None
+    masks, rest = [], full
+    while rest:
+        route = memo[rest][1]
+        masks.append(route)
+        rest &= ~route
+    return cost, masks
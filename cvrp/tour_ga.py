@@ -0,0 +1,112 @@
+"""
+Genetic algorithm over giant-tour chromosomes.
+
+A chromosome is a permutation of the customers; cvrp.split decodes it into
+the best capacity-feasible routes in O(n), so every child is complete and
+valid and its fitness is exact. Children come from order crossover (OX)
+plus an occasional segment reversal, are educated by 2-opt on the decoded
+routes (re-encoded into the tour, Lamarckian style) and replace the worst
+individual of a steady-state population. Children whose cost is already in
+the population are discarded as clones, which keeps the population from
+collapsing onto one solution.
+
+The initial population comes from cvrp.population's mix of randomised
+constructions. Children share most of their routes with their parents, so
+2-opt results are memoised per customer sequence and each distinct route
+is only optimised once.
+"""
+
+import random
+import time
+
+import numpy as np
+
+from cvrp.local_search import two_opt, two_opt_submatrix
+from cvrp.population import diverse_population
+from cvrp.split import giant_tour, split
+
+MEMO_LIMIT = 200000     # Educated routes remembered before the memo is reset
+
+def order_crossover(parent1, parent2, rng=random):
+    """OX: keeps a random slice of parent1 and fills the other positions in parent2's order, wrapping after the slice."""
+    m = len(parent1)
+    i, j = sorted(rng.sample(range(m + 1), 2))     # Slice [i, j)
+    kept = set(parent1[i:j])
+    fill = [c for c in parent2[j:] + parent2[:j] if c not in kept]
+    return fill[m - j:] + parent1[i:j] + fill[:m - j]
+
+def mutate(tour, rng=random):
+    """Reverses a random segment of the tour in place."""
+    if len(tour) > 1:
+        i, j = sorted(rng.sample(range(len(tour) + 1), 2))
+        tour[i:j] = tour[i:j][::-1]
+    return tour
+
+def educate_route(route, D, memo):
+    """Returns the 2-opt optimised version of a route, computing it only for sequences not seen before."""
+    key = tuple(route)
+    improved = memo.get(key)
+    if improved is None:
+        if len(memo) >= MEMO_LIMIT:
+            memo.clear()
+        improved = memo[key] = two_opt_submatrix(route, D) if isinstance(D, np.ndarray) else two_opt(route, D)
+    return improved
+
+def decode(tour, Q, D, q, memo=None):
+    """Splits a tour into routes, improving them with 2-opt unless memo is None; returns (cost, tour, routes).
+
+    D may be nested lists or an ndarray (see split() and two_opt_submatrix()).
+    """
+    cost, routes = split(tour, Q, D, q)
+    if memo is not None:
+        routes = [educate_route(route, D, memo) for route in routes]
+        # The improved routes are one feasible cutting of the new tour, so Split can only do better
+        tour = giant_tour(routes)
+        cost, routes = split(tour, Q, D, q)
+    return cost, tour, routes
+
+def tournament(population, rng=random, size=2):
+    """Returns the cheapest of `size` randomly drawn individuals."""
+    return min(rng.sample(population, size), key=lambda individual: individual[0])
+
+def initial_population(n, Q, D, q, size, rng=random, memo=None):
+    """Tours of cvrp.population's diverse seeds, all decoded; cost clones are dropped."""
+    population, costs = [], set()
+    for routes in diverse_population(n, Q, D, q, size, rng):
+        individual = decode(giant_tour(routes), Q, D, q, memo)
+        if individual[0] not in costs:
+            population.append(individual)
+            costs.add(individual[0])
+    return population
+
+def evolve(population, Q, D, q, iterations, mutation_prob=0.2, memo=None, deadline=None, rng=random):
+    """Runs steady-state generations on `population` in place and returns it (memo as in decode())."""
+    costs = {individual[0] for individual in population}
+    for it in range(iterations):
+        if deadline is not None and not it & 63 and time.perf_counter() > deadline:
+            break
+        child = order_crossover(tournament(population, rng)[1], tournament(population, rng)[1], rng)
+        if rng.random() < mutation_prob:
+            mutate(child, rng)
+
+        individual = decode(child, Q, D, q, memo)
+        if individual[0] in costs:
+            continue    # Clone of an existing individual
+
+        worst = max(range(len(population)), key=lambda k: population[k][0])
+        if individual[0] < population[worst][0]:
+            costs.discard(population[worst][0])
+            costs.add(individual[0])
+            population[worst] = individual
+    return population
+
+def solve_cvrp(n, Q, D, q, population_size=30, iterations=3000, mutation_prob=0.2, time_limit=None, educate=True):
+    """Solves the CVRP with a giant-tour GA: OX crossover, Split decoding and 2-opt education."""
+    if n <= 1:
+        return []
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    memo = {} if educate else None
+    population = initial_population(n, Q, D, q, population_size, memo=memo)
+    if len(population) > 1:
+        evolve(population, Q, D, q, iterations, mutation_prob, memo, deadline)
+    return min(population, key=lambda individual: individual[0])[2]
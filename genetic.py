@@ -2,6 +2,11 @@ import sys
 import random
 import math
 
+from cvrp import tour_ga
+from cvrp.instance import read_input
+from cvrp.population import diverse_population
+from cvrp.routes import calculate_route_distance, check, route_load
+
 #  GENETIC 
 
 # 
@@ -28,63 +33,6 @@ This reads input from 1.in and prints output to 1.out.
 # Selection ensures that better solutions are more likely to propagate to future generations.
 # Fitness drives the search towards better solutions by minimizing the total travel distance.
 
-def read_input():
-    """Reads input from stdin and returns number of locations, vehicle capacity, distance matrix, and demand vector."""
-    n = int(sys.stdin.readline().strip())   # Number of locations (including depot)
-    Q = int(sys.stdin.readline().strip())   # Vehicle capacity
-    
-    D = []
-    for _ in range(n):
-        D.append(list(map(int, sys.stdin.readline().strip().split())))  # Distance matrix
-    
-    q = list(map(int, sys.stdin.readline().strip().split()))    # Demand vector
-    
-    return n, Q, D, q
-
-def calculate_route_distance(route, D):
-    """Calculates total distance of a given route."""
-    return sum(D[route[i]][route[i + 1]] for i in range(len(route) - 1))
-
-def total_distance(routes, D):
-    """Calculates total distance for all routes."""
-    return sum(calculate_route_distance(route, D) for route in routes)
-
-def is_valid_route(route, Q, q):
-    """Check if a route does not exceed the vehicle capacity"""
-    total_demand = sum([q[i] for i in route if i != 0])  # Exclude depot (0)
-    return total_demand <= Q
-
-def initial_solution(n, Q, D, q):
-    """Creates an initial greedy solution for CVRP."""
-    unvisited = set(range(1, n))  # Customers (excluding depot)
-    routes = []
-    
-    while unvisited:
-        route = [0]  # Start at the depot
-        load = 0
-        current = 0  # Last visited location (initial depot)
-        
-        while unvisited:
-            # Find the nearest feasible customer
-            next_customer = min(
-                (c for c in unvisited if load + q[c] <= Q), # Feasible customers
-                key=lambda c: D[current][c],                # Choose the nearest customer
-                default=None                    # If no customer can be served, return None
-            )
-            
-            if next_customer is None:
-                break       # No more feasible customers, return to depot
-            
-            route.append(next_customer)     
-            load += q[next_customer]
-            current = next_customer
-            unvisited.remove(next_customer)
-        
-        route.append(0)  # Return to depot
-        routes.append(route)
-    
-    return routes
-
 # def crossover(parent1, parent2):
 #     """Perform a one-point crossover between two parent solutions. Recombination"""
     
@@ -103,25 +51,82 @@ def initial_solution(n, Q, D, q):
     
 #     return child
 
-def crossover(parent1, parent2, Q, q):
-    """Perform crossover, ensuring the child solution is valid."""
-    for _ in range(5):  # Try up to 5 times to get a valid child
-        crossover_point = random.randint(1, len(parent1) - 2)
-        
-        # Create a child solution by combining parent routes
-        child_routes = parent1[:crossover_point] + parent2[crossover_point:]
-
-        # Ensure valid routes (not just a flat list of nodes)
-        valid_routes = []
-        for route in child_routes:
-            if is_valid_route(route, Q, q):
-                valid_routes.append(route)
-        
-        if valid_routes:
-            return valid_routes  # Return a valid set of routes
-    
-    return parent1  # If no valid solution found, return parent1
+class Individual:
+    """A solution with its cost and per-route distances and loads cached.
+
+    Routes are shared between individuals and never modified in place, so
+    operators build children from the parents' cached route data and only
+    re-evaluate the routes they actually change.
+    """
+    __slots__ = ("routes", "distances", "loads", "cost")
+
+    def __init__(self, routes, distances, loads, Q):
+        self.routes = routes
+        self.distances = distances
+        self.loads = loads
+        # Infinite cost for invalid solutions
+        self.cost = sum(distances) if all(load <= Q for load in loads) else float('inf')
+
+def evaluate(routes, D, Q, q):
+    """Wraps routes in an Individual, computing each route's distance and load once."""
+    return Individual(routes, [calculate_route_distance(route, D) for route in routes],
+                      [route_load(route, q) for route in routes], Q)
+
+def insert_cheapest(routes, distances, loads, customer, Q, q, D):
+    """Inserts a customer where it adds the least distance among routes with room, or into a new route."""
+    best = None
+    for r, route in enumerate(routes):
+        if loads[r] + q[customer] > Q:
+            continue
+        for i in range(1, len(route)):
+            a, b = route[i - 1], route[i]
+            delta = D[a][customer] + D[customer][b] - D[a][b]
+            if best is None or delta < best[0]:
+                best = (delta, r, i)
+
+    if best is None:
+        routes.append([0, customer, 0])
+        distances.append(D[0][customer] + D[customer][0])
+        loads.append(q[customer])
+        return
+    delta, r, i = best
+    routes[r] = routes[r][:i] + [customer] + routes[r][i:]   # Copy on write, the old route may be shared
+    distances[r] += delta
+    loads[r] += q[customer]
+
+def crossover(parent1, parent2, Q, q, D):
+    """Perform crossover, ensuring the child visits every customer exactly once and respects capacity."""
+    if len(parent1.routes) < 3:
+        return parent1
+    crossover_point = random.randint(1, len(parent1.routes) - 2)
+
+    # Create a child solution by combining parent routes, their cached distances and loads come along
+    routes = parent1.routes[:crossover_point]
+    distances = parent1.distances[:crossover_point]
+    loads = parent1.loads[:crossover_point]
+    seen = {c for route in routes for c in route[1:-1]}
+
+    for route, distance, load in zip(parent2.routes[crossover_point:], parent2.distances[crossover_point:],
+                                     parent2.loads[crossover_point:]):
+        if not seen.isdisjoint(route):
+            # Drop customers the first part already serves; only this route needs re-measuring
+            route = [c for c in route if c not in seen]
+            if len(route) == 2:
+                continue
+            distance, load = calculate_route_distance(route, D), route_load(route, q)
+        routes.append(route)
+        distances.append(distance)
+        loads.append(load)
+        seen.update(route[1:-1])
+
+    # Customers neither part served go back in at their cheapest feasible position
+    for route in parent1.routes[crossover_point:]:
+        for c in route[1:-1]:
+            if c not in seen:
+                insert_cheapest(routes, distances, loads, c, Q, q, D)
+                seen.add(c)
 
+    return Individual(routes, distances, loads, Q)
 
 # def mutate(solution, Q, q):
 #     """Apply mutation to a solution by swapping two customers within a route."""
@@ -132,26 +137,29 @@ def crossover(parent1, parent2, Q, q):
     
 #     return solution
 
-def mutate(solution, Q, q):
-    """Apply mutation only if the new solution remains valid."""
+def mutate(solution, Q, q, D):
+    """Apply mutation by swapping two customers within a route; only that route is re-evaluated."""
     for _ in range(5):
-        route = random.choice(solution)
+        r = random.randrange(len(solution.routes))
+        route = solution.routes[r]
         if len(route) > 3:
             i, j = sorted(random.sample(range(1, len(route) - 1), 2))
+            route = route[:]    # Copy on write, other individuals may share this route
             route[i], route[j] = route[j], route[i]
 
-            if all(is_valid_route(route, Q, q) for route in solution):
-                return solution
+            routes = solution.routes[:]
+            routes[r] = route
+            distances = solution.distances[:]
+            distances[r] = calculate_route_distance(route, D)
+            # A swap inside one route leaves every load, and so validity, unchanged
+            return Individual(routes, distances, solution.loads, Q)
     return solution
 
 def fitness(solution, D, Q, q):
     """Calculate fitness based on the total distance of the routes."""
 
-    # solution is valid (doesn't exceed vehicle capacity). fitness = total distance
-    if all(is_valid_route(route, Q, q) for route in solution):
-        return total_distance(solution, D)
-    else:
-        return float('inf')  # Return a high cost for invalid solutions
+    # Cached when the Individual was built: total distance, or inf if a route exceeds capacity
+    return solution.cost
 
 def selection(population, D, Q, q):
     """Select two parents using tournament selection."""
@@ -163,8 +171,7 @@ def selection(population, D, Q, q):
     # while there're some randomness to avoid premature
     for _ in range(2):
         tournament = random.sample(population, tournament_size)
-        tournament_fitness = [(ind, fitness(ind, D, Q, q)) for ind in tournament]
-        parents.append(min(tournament_fitness, key=lambda x: x[1])[0])
+        parents.append(min(tournament, key=lambda ind: ind.cost))   # Cached, no re-evaluation
     return parents
 
 def repair_solution(solution, Q, q):
@@ -207,28 +214,36 @@ def repair_solution(solution, Q, q):
 # crossover_prob = likelihood that crossover will occur
 # mutation_prob = likelihood that mutation will occur in a child solution 
 #               (lower focus refining solutions, higher increases exploration)
-def solve_cvrp(n, Q, D, q, population_size=100, generations=1000, mutation_prob=0.1, crossover_prob=0.7):
+# mode = "routes" evolves route lists as below, "giant-tour" runs the permutation + Split GA in cvrp/tour_ga.py
+#        with population_size, generations (as iterations) and mutation_prob passed on when given; it always
+#        crosses parents, so crossover_prob is rejected there
+def solve_cvrp(n, Q, D, q, population_size=None, generations=None, mutation_prob=None, crossover_prob=None,
+               mode="routes"):
     """Solve CVRP using a Genetic Algorithm."""
-    # Initialize population with random solutions
-    population = []
-
-    # Ensure the population only contains valid solutions
-    while len(population) < population_size:
-        candidate = initial_solution(n, Q, D, q)
-        if candidate:
-            population.append(candidate)
+    if mode == "giant-tour":
+        if crossover_prob is not None:
+            raise ValueError("crossover_prob does not apply to mode='giant-tour'")
+        given = {"population_size": population_size, "iterations": generations, "mutation_prob": mutation_prob}
+        return tour_ga.solve_cvrp(n, Q, D, q, **{key: value for key, value in given.items() if value is not None})
+    if mode != "routes":
+        raise ValueError(f"unknown mode {mode!r}")
+    population_size = 100 if population_size is None else population_size
+    generations = 1000 if generations is None else generations
+    mutation_prob = 0.1 if mutation_prob is None else mutation_prob
+    crossover_prob = 0.7 if crossover_prob is None else crossover_prob
+
+    # Initialize population with diverse seeds (greedy, randomised greedy, sweep, perturbed savings, random tours)
+    # sharing one neighbour index, instead of population_size copies of the same greedy solution
+    population = [evaluate(routes, D, Q, q) for routes in diverse_population(n, Q, D, q, population_size)]
     
     best_solution = None
     best_distance = float('inf')
     
     for _ in range(generations):
-        # Evaluate the fitness of all solutions
-        population_fitness = [(ind, fitness(ind, D, Q, q)) for ind in population]
-        
+        # Fitness is cached on every individual, each child was evaluated once when it was built
         # Get the best solution in the current generation
-        # current_best_solution = min(population_fitness, key=lambda x: x[1])[0]
-        # current_best_distance = fitness(current_best_solution, D, Q, q)
-        current_best_solution, current_best_distance = min(population_fitness, key=lambda x: x[1])
+        current_best_solution = min(population, key=lambda ind: ind.cost)
+        current_best_distance = current_best_solution.cost
         
         if current_best_distance < best_distance:
             best_solution = current_best_solution
@@ -244,36 +259,23 @@ def solve_cvrp(n, Q, D, q, population_size=100, generations=1000, mutation_prob=
             
             # Perform crossover to create a new child
             if random.random() < crossover_prob:
-                child = crossover(parents[0], parents[1], Q, q)
+                child = crossover(parents[0], parents[1], Q, q, D)
             else:
                 # If no crossover, just duplicate one of the parents
                 child = parents[0]
             
             # Apply mutation with probability mutation_prob
             if random.random() < mutation_prob:
-                child = mutate(child, Q, q)
+                child = mutate(child, Q, q, D)
             
-            if all(is_valid_route(route, Q, q) for route in child):
+            if child.cost != float('inf'):
                 next_generation.append(child)
         
         # Prevent empty population
         if next_generation:
             population = next_generation
     
-    return best_solution # Only return the best valid solution
-
-def check(routes, n, Q, D, q):
-    node_visited = []
-    for route in routes:
-        total_demand = sum([q[i] for i in route if i != 0])
-        if not (total_demand <= Q):
-            return False
-        node_visited += route
-
-    if len(set(node_visited)) != len(q):
-        return False
-
-    return True
+    return best_solution.routes # Only return the best valid solution
 
 def main():
     n, Q, D, q = read_input()
@@ -2,12 +2,21 @@ import sys
 import itertools
 import heapq
 
+import numpy as np
+
+from cvrp.instance import load_instance
+from cvrp.neighbors import nearest_neighbors
+from cvrp.routes import check
+
 # GREEDY PRIORITY QUEUE
 # 821774 Score
 # 3102ms Total Time
 # 180ms Peak Time
 # 20.1 MiB Peak Memory
 
+# COMPLEXITY O(n^2) for the k-nearest-neighbour lists, then O(n k log k) for construction
+# One heap per current customer over its neighbours, plus lazy depot and demand heaps shared by all routes
+
 """
 To use this file with example testcases, run: 
 
@@ -16,70 +25,81 @@ python vrp.py < 1.in > 1.out
 This reads input from 1.in and prints output to 1.out. 
 """
 
-def read_input():
-    """Reads input from stdin and returns number of locations, vehicle capacity, distance matrix, and demand vector."""
-    n = int(sys.stdin.readline().strip())   # Number of locations (including depot)
-    Q = int(sys.stdin.readline().strip())   # Vehicle capacity
-    
-    D = []
-    for _ in range(n):
-        D.append(list(map(int, sys.stdin.readline().strip().split())))  # Distance matrix
-    
-    q = list(map(int, sys.stdin.readline().strip().split()))    # Demand vector
-    
-    return n, Q, D, q
+def _nearest_feasible(D, demand, alive, current, capacity):
+    """Vectorised fallback: the nearest unvisited customer that fits, ties to the lowest index."""
+    candidates = np.flatnonzero(alive & (demand <= capacity))
+    return int(candidates[np.argmin(D[current, candidates])])
 
-def solve_cvrp(n, Q, D, q):
+def solve_cvrp(n, Q, D, q, k=16):
     """Enhanced greedy heuristic to solve the Capacitated Vehicle Routing Problem."""
-    unvisited = set(range(1, n))  # Customers (excluding depot)
+    D = np.asarray(D)
+    demand = np.asarray(q)
+    q = demand.tolist()
+    neighbors = nearest_neighbors(D, k).tolist()
+
+    alive = np.ones(n, dtype=bool)
+    alive[0] = False
+    visited = [False] * n
+    visited[0] = True
+
+    # Lazy heaps: entries of visited customers are only dropped when they reach the top
+    depot_pq = list(zip(D[0, 1:].tolist(), range(1, n)))   # Every route starts here, so it holds all customers
+    heapq.heapify(depot_pq)
+    demand_pq = list(zip(q[1:], range(1, n)))               # Smallest remaining demand
+    heapq.heapify(demand_pq)
+
+    remaining = n - 1
     routes = []
-    
-    while unvisited:
+    while remaining:
         route = [0]  # Start at the depot
         load = 0
         current = 0
         
-        # Use a priority queue to store potential customers based on distance and feasibility
-        pq = []
-        for c in unvisited:
-            if load + q[c] <= Q:  # Only feasible customers
-                heapq.heappush(pq, (D[current][c], c))  # Push customer with distance
-        
-        # Greedily select the nearest customer
-        while pq:
-            _, next_customer = heapq.heappop(pq)
-            if load + q[next_customer] <= Q:
-                route.append(next_customer)
-                load += q[next_customer]
-                current = next_customer
-                unvisited.remove(next_customer)
-                
-                # Rebuild priority queue for remaining unvisited customers
-                pq = []
-                for c in unvisited:
-                    if load + q[c] <= Q:
-                        heapq.heappush(pq, (D[current][c], c))
+        while remaining:
+            while visited[demand_pq[0][1]]:
+                heapq.heappop(demand_pq)
+            if load + demand_pq[0][0] > Q:
+                break       # No more feasible customers, return to depot
+
+            if current == 0:
+                # Capacity is full at the start of a route, so the nearest unvisited customer
+                # fits unless it exceeds Q on its own, and then no route can ever serve it
+                while visited[depot_pq[0][1]]:
+                    heapq.heappop(depot_pq)
+                next_customer = heapq.heappop(depot_pq)[1]
+                if q[next_customer] > Q:
+                    raise ValueError(f"customer {next_customer} has demand {q[next_customer]} > capacity {Q}")
+            else:
+                # The current customer is only ever left once, so its heap of nearest neighbours is used up here
+                near = neighbors[current]
+                pq = [(d, c) for d, c in zip(D[current, near].tolist(), near) if not visited[c]]
+                heapq.heapify(pq)
+                next_customer = None
+                while pq:
+                    _, c = heapq.heappop(pq)
+                    if load + q[c] <= Q:  # Capacity-infeasible entries are discarded as they surface
+                        next_customer = c
+                        break
+                if next_customer is None:
+                    next_customer = _nearest_feasible(D, demand, alive, current, Q - load)
+
+            route.append(next_customer)
+            load += q[next_customer]
+            current = next_customer
+            visited[next_customer] = True
+            alive[next_customer] = False
+            remaining -= 1
         
+        if len(route) == 1:
+            raise ValueError(f"customer {demand_pq[0][1]} has demand {demand_pq[0][0]} > capacity {Q}")
         route.append(0)  # Return to depot
         routes.append(route)
     
     return routes
 
-def check(routes, n, Q, D, q):
-    node_visited = []
-    for route in routes:
-        total_demand = sum([q[i] for i in route if i != 0])
-        if not (total_demand <= Q):
-            return False
-        node_visited += route
-
-    if len(set(node_visited)) != len(q):
-        return False
-
-    return True
-
 def main():
-    n, Q, D, q = read_input()
+    n, Q, D, q = load_instance()
+    q = q.tolist()
     routes = solve_cvrp(n, Q, D, q)
 
     if check(routes, n, Q, D, q): 
@@ -3,6 +3,9 @@ import itertools
 import random
 import math
 
+from cvrp.instance import read_input
+from cvrp.routes import check, initial_solution, is_valid_route, total_distance
+
 # SIMULATED ANNEALING
 
 ### cooling_rate=0.995 
@@ -23,59 +26,6 @@ python vrp.py < 1.in > 1.out
 This reads input from 1.in and prints output to 1.out. 
 """
 
-def read_input():
-    """Reads input from stdin and returns number of locations, vehicle capacity, distance matrix, and demand vector."""
-    n = int(sys.stdin.readline().strip())   # Number of locations (including depot)
-    Q = int(sys.stdin.readline().strip())   # Vehicle capacity
-    
-    D = []
-    for _ in range(n):
-        D.append(list(map(int, sys.stdin.readline().strip().split())))  # Distance matrix
-    
-    q = list(map(int, sys.stdin.readline().strip().split()))    # Demand vector
-    
-    return n, Q, D, q
-
-def calculate_route_distance(route, D):
-    """Calculates total distance of a given route."""
-    return sum(D[route[i]][route[i + 1]] for i in range(len(route) - 1))
-
-def is_valid_route(route, Q, q):
-    """Check if a route does not exceed the vehicle capacity"""
-    total_demand = sum([q[i] for i in route if i != 0])  # Exclude depot (0)
-    return total_demand <= Q
-
-def initial_solution(n, Q, D, q):
-    """Creates an initial greedy solution for CVRP."""
-    unvisited = set(range(1, n))  # Customers (excluding depot)
-    routes = []
-    
-    while unvisited:
-        route = [0]  # Start at the depot
-        load = 0
-        current = 0  # Last visited location (initial depot)
-        
-        while unvisited:
-            # Find the nearest feasible customer
-            next_customer = min(
-                (c for c in unvisited if load + q[c] <= Q), # Feasible customers
-                key=lambda c: D[current][c],                # Choose the nearest customer
-                default=None                    # If no customer can be served, return None
-            )
-            
-            if next_customer is None:
-                break       # No more feasible customers, return to depot
-            
-            route.append(next_customer)     
-            load += q[next_customer]
-            current = next_customer
-            unvisited.remove(next_customer)
-        
-        route.append(0)  # Return to depot
-        routes.append(route)
-    
-    return routes
-
 def perturb_solution(routes, Q, q, D):
     """Randomly perturbs the solution by swapping customers within a route or between routes."""
     new_routes = [route[:] for route in routes]
@@ -95,10 +45,6 @@ def perturb_solution(routes, Q, q, D):
     
     return routes   # Otherwise, return original solution
 
-def total_distance(routes, D):
-    """Calculates total distance for all routes."""
-    return sum(calculate_route_distance(route, D) for route in routes)
-
 def solve_cvrp(n, Q, D, q, max_iter=5000, initial_temp=1000, cooling_rate=0.997):
     """Solves the CVRP using simulated annealing."""
     current_solution = initial_solution(n, Q, D, q)
@@ -132,19 +78,6 @@ def solve_cvrp(n, Q, D, q, max_iter=5000, initial_temp=1000, cooling_rate=0.997)
     
     return best_solution
 
-def check(routes, n, Q, D, q):
-    node_visited = []
-    for route in routes:
-        total_demand = sum([q[i] for i in route if i != 0])
-        if not (total_demand <= Q):
-            return False
-        node_visited += route
-
-    if len(set(node_visited)) != len(q):
-        return False
-
-    return True
-
 def main():
     n, Q, D, q = read_input()
     routes = solve_cvrp(n, Q, D, q)
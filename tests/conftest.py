@@ -0,0 +1,61 @@
+import itertools
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+@pytest.fixture
+def instance_path():
+    """Returns the path of a shipped instance, e.g. instance_path("1.in")."""
+    return lambda name: os.path.join(ROOT, name)
+
+@pytest.fixture
+def read_lists(instance_path):
+    """Reads a shipped instance as (n, Q, D, q) with nested lists, without writing a sidecar."""
+    from cvrp.instance import load_instance
+
+    def read(name):
+        n, Q, D, q = load_instance(instance_path(name), cache=False)
+        return n, Q, D.tolist(), q.tolist()
+    return read
+
+def exhaustive_cost(n, Q, D, q):
+    """Optimal CVRP cost by trying every customer order and every way of cutting it into routes."""
+    best = None
+    customers = list(range(1, n))
+    for order in itertools.permutations(customers):
+        for cuts in itertools.product([False, True], repeat=len(order) - 1):
+            cost, load, last = 0, 0, 0
+            for c, cut in zip(order, (True,) + cuts):
+                if cut:
+                    cost += D[last][0] + D[0][c]
+                    load = 0
+                else:
+                    cost += D[last][c]
+                load += q[c]
+                if load > Q:
+                    break
+                last = c
+            else:
+                cost += D[last][0]
+                if best is None or cost < best:
+                    best = cost
+    return best
+
+@pytest.fixture
+def small_instances():
+    """Random instances with up to 6 customers, each paired with its optimal cost."""
+    instances = []
+    for seed in range(15):
+        rng = random.Random(seed)
+        n = rng.randint(2, 7)
+        points = [(rng.randint(0, 50), rng.randint(0, 50)) for _ in range(n)]
+        D = [[round(((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5) for x2, y2 in points] for x1, y1 in points]
+        q = [0] + [rng.randint(1, 10) for _ in range(n - 1)]
+        Q = rng.randint(10, 25)
+        instances.append(((n, Q, D, q), exhaustive_cost(n, Q, D, q)))
+    return instances
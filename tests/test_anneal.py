@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from cvrp.anneal import _inter_swap_delta, _intra_swap_delta, _relocate_delta, anneal
+from cvrp.neighbors import neighbor_lists
+from cvrp.routes import check, initial_solution, total_distance
+
+def random_instance(rng, n=12):
+    D = [[0 if i == j else rng.randint(1, 50) for j in range(n)] for i in range(n)]     # Asymmetric
+    customers = list(range(1, n))
+    rng.shuffle(customers)
+    cut = rng.randint(2, n - 3)
+    return D, [[0] + customers[:cut] + [0], [0] + customers[cut:] + [0]]
+
+@pytest.mark.parametrize("seed", range(20))
+def test_deltas_match_recomputed_cost(seed):
+    rng = random.Random(seed)
+    D, routes = random_instance(rng)
+    before = total_distance(routes, D)
+    r1, r2 = routes
+
+    i, j = sorted(rng.sample(range(1, len(r1) - 1), 2))
+    swapped = list(r1)
+    swapped[i], swapped[j] = swapped[j], swapped[i]
+    assert _intra_swap_delta(r1, i, j, D) == total_distance([swapped, r2], D) - before
+
+    i, p = rng.randrange(1, len(r1) - 1), rng.randrange(1, len(r2))
+    shorter, longer = list(r1), list(r2)
+    longer.insert(p, shorter.pop(i))
+    assert _relocate_delta(r1, i, r2, p, D) == total_distance([shorter, longer], D) - before
+
+    i, j = rng.randrange(1, len(r1) - 1), rng.randrange(1, len(r2) - 1)
+    a, b = list(r1), list(r2)
+    a[i], b[j] = b[j], a[i]
+    assert _inter_swap_delta(r1, i, r2, j, D) == total_distance([a, b], D) - before
+
+@pytest.mark.parametrize("k", [None, 5])
+def test_tracked_distance_matches_result(read_lists, k):
+    n, Q, D, q = read_lists("1.in")
+    routes = initial_solution(n, Q, D, q)
+    neighbors = neighbor_lists(D, k) if k else None
+    best_routes, best_distance = anneal(routes, Q, D, q, max_iter=20000, neighbors=neighbors, rng=random.Random(0))
+    best_routes = [route for route in best_routes if len(route) > 2]
+    assert check(best_routes, n, Q, D, q)
+    assert best_distance == total_distance(best_routes, D)
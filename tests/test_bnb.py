@@ -0,0 +1,60 @@
+import io
+import time
+
+import pytest
+
+from cvrp.bnb import branch_and_bound, depth_first, route_branch_and_bound
+from cvrp.registry import load_solver
+from cvrp.routes import check, total_distance
+from cvrp.subsets import route_costs
+
+OPTIMUM_1 = 804
+
+def test_best_first_optimum_on_1_in(read_lists):
+    n, Q, D, q = read_lists("1.in")
+    routes = load_solver("bnb")(n, Q, D, q)
+    assert check(routes, n, Q, D, q)
+    assert total_distance(routes, D) == OPTIMUM_1
+
+def test_customer_level_search_is_exact(small_instances):
+    for (n, Q, D, q), optimum in small_instances:
+        cost, routes, proven = branch_and_bound(n, Q, D, q)
+        assert proven and cost == optimum
+        assert check(routes, n, Q, D, q)
+        assert total_distance(routes, D) == cost
+
+def test_route_level_search_is_exact(small_instances):
+    for (n, Q, D, q), optimum in small_instances:
+        cost, routes, proven = route_branch_and_bound(n, Q, D, q, *route_costs(n, Q, D, q))
+        assert proven and cost == optimum
+        assert total_distance(routes, D) == cost
+
+def test_best_first_time_limit_counts_the_setup(read_lists):
+    n, Q, D, q = read_lists("3.in")
+    start = time.perf_counter()
+    cost, routes, proven = branch_and_bound(n, Q, D, q, time_limit=0.5)
+    assert time.perf_counter() - start < 1.5
+    assert not proven
+    assert check(routes, n, Q, D, q) and total_distance(routes, D) == cost
+
+@pytest.mark.parametrize("mode", ["depth-first", "discrepancy"])
+def test_depth_first_modes_on_1_in(read_lists, mode):
+    n, Q, D, q = read_lists("1.in")
+    routes = load_solver("bnb")(n, Q, D, q, mode=mode)
+    assert check(routes, n, Q, D, q)
+    assert total_distance(routes, D) == OPTIMUM_1
+
+@pytest.mark.parametrize("discrepancy", [False, True])
+@pytest.mark.parametrize("route_limit", [None, 0])
+def test_depth_first_proves_the_optimum(small_instances, discrepancy, route_limit):
+    # route_limit=0 forces the customer-level tree
+    for (n, Q, D, q), optimum in small_instances:
+        cost, routes, lower = depth_first(n, Q, D, q, discrepancy=discrepancy, route_limit=route_limit)
+        assert cost == lower == optimum
+        assert check(routes, n, Q, D, q) and total_distance(routes, D) == cost
+
+def test_depth_first_reports_progress(read_lists):
+    n, Q, D, q = read_lists("1.in")
+    log = io.StringIO()
+    depth_first(n, Q, D, q, report_every=1e-9, log=log)
+    assert "incumbent 804" in log.getvalue().splitlines()[-2]
@@ -0,0 +1,38 @@
+import pytest
+
+from cvrp.bnb import dual_prices
+from cvrp.registry import load_solver
+from cvrp.routes import check, total_distance
+from cvrp.subsets import best_partition, route_costs
+
+def test_optimum_on_1_in(read_lists):
+    n, Q, D, q = read_lists("1.in")
+    routes = load_solver("brute")(n, Q, D, q)
+    assert check(routes, n, Q, D, q)
+    assert total_distance(routes, D) == 804
+
+def test_matches_exhaustive_search(small_instances):
+    solve_cvrp = load_solver("brute")
+    for (n, Q, D, q), optimum in small_instances:
+        routes = solve_cvrp(n, Q, D, q)
+        assert check(routes, n, Q, D, q)
+        assert total_distance(routes, D) == optimum
+
+def test_rejects_oversized_customer():
+    with pytest.raises(ValueError):
+        load_solver("brute")(3, 5, [[0, 1, 1], [1, 0, 1], [1, 1, 0]], [0, 6, 1])
+
+def test_falls_back_to_branch_and_bound_past_the_route_limit(small_instances):
+    solve_cvrp = load_solver("brute")
+    for (n, Q, D, q), optimum in small_instances:
+        routes = solve_cvrp(n, Q, D, q, route_limit=1)
+        assert check(routes, n, Q, D, q)
+        assert total_distance(routes, D) == optimum
+
+def test_partition_with_prices_matches_plain_partition(read_lists):
+    n, Q, D, q = read_lists("1.in")
+    costs, loads = route_costs(n, Q, D, q)
+    plain = best_partition(n, costs)
+    priced = best_partition(n, costs, dual_prices(n, costs, loads, q))
+    assert plain[0] == priced[0] == 804
+    assert sum(costs[mask] for mask in priced[1]) == 804
@@ -0,0 +1,51 @@
+import shutil
+
+import numpy as np
+import pytest
+
+from cvrp.cache import HEADER, sidecar_path
+from cvrp.instance import load_instance
+
+@pytest.fixture
+def copied(instance_path, tmp_path):
+    path = tmp_path / "1.in"
+    shutil.copy(instance_path("1.in"), path)
+    return str(path)
+
+def assert_same(loaded, expected):
+    assert loaded[:2] == expected[:2]
+    assert np.array_equal(loaded[2], expected[2])
+    assert np.array_equal(loaded[3], expected[3])
+
+def test_round_trip(copied):
+    parsed = load_instance(copied, cache=False)
+    first = load_instance(copied)                  # Parses and writes the sidecar
+    assert_same(first, parsed)
+    second = load_instance(copied)                 # Memory-maps the sidecar
+    assert isinstance(second[2], np.memmap)
+    assert_same(second, parsed)
+
+@pytest.mark.parametrize("offset, data", [
+    (0, b"NOTCVRP\0"),                  # Magic
+    (12, b"\xff\xfe\0\0"),              # dtype that is not ASCII
+    (12, b"zz\0\0"),                    # dtype numpy does not know
+    (12, b"<f8\0"),                     # Not an integer dtype
+    (HEADER.size - 32, b"\0" * 32),     # Digest of other content
+])
+def test_corrupt_header_is_rebuilt(copied, offset, data):
+    expected = load_instance(copied, cache=False)
+    load_instance(copied)
+    path = sidecar_path(copied)
+    with open(path, "r+b") as f:
+        f.seek(offset)
+        f.write(data)
+    assert_same(load_instance(copied), expected)
+    assert isinstance(load_instance(copied)[2], np.memmap)     # And the sidecar was rewritten
+
+def test_truncated_sidecar_is_rebuilt(copied):
+    expected = load_instance(copied, cache=False)
+    load_instance(copied)
+    path = sidecar_path(copied)
+    with open(path, "r+b") as f:
+        f.truncate(HEADER.size + 10)
+    assert_same(load_instance(copied), expected)
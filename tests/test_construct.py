@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from cvrp.construct import greedy_routes, masked_greedy_routes
+
+def scan_greedy(n, Q, D, q):
+    """Nearest feasible unvisited customer by scanning every customer at each step, lowest index on ties."""
+    unvisited = set(range(1, n))
+    routes = []
+    while unvisited:
+        route, capacity, current = [0], Q, 0
+        while True:
+            fits = [c for c in sorted(unvisited) if q[c] <= capacity]
+            if not fits:
+                break
+            current = min(fits, key=lambda c: D[current][c])
+            route.append(current)
+            capacity -= q[current]
+            unvisited.remove(current)
+        routes.append(route + [0])
+    return routes
+
+def random_instance(seed):
+    rng = random.Random(seed)
+    n = rng.randint(2, 40)
+    D = [[0 if i == j else rng.randint(1, 20) for j in range(n)] for i in range(n)]    # Many ties
+    q = [0] + [rng.randint(1, 10) for _ in range(n - 1)]
+    return n, rng.randint(10, 30), D, q
+
+@pytest.mark.parametrize("seed", range(30))
+@pytest.mark.parametrize("k", [1, 4, 16])
+def test_greedy_routes_match_a_full_scan(seed, k):
+    n, Q, D, q = random_instance(seed)
+    assert greedy_routes(n, Q, D, q, k=k) == scan_greedy(n, Q, D, q)
+
+def test_greedy_routes_reject_oversized_customer():
+    with pytest.raises(ValueError):
+        greedy_routes(3, 5, [[0, 1, 1], [1, 0, 1], [1, 1, 0]], [0, 6, 1])
+
+@pytest.mark.parametrize("seed", range(30))
+def test_masked_greedy_matches_lazy_greedy(seed):
+    n, Q, D, q = random_instance(seed)
+    assert masked_greedy_routes(n, Q, D, q) == greedy_routes(n, Q, D, q)
+
+@pytest.mark.parametrize("name", ["1.in", "2.in", "3.in", "4.in", "5.in"])
+def test_masked_greedy_matches_lazy_greedy_on_shipped_instances(read_lists, name):
+    n, Q, D, q = read_lists(name)
+    assert masked_greedy_routes(n, Q, D, q) == greedy_routes(n, Q, D, q)
+
+def test_masked_greedy_rejects_oversized_customer():
+    with pytest.raises(ValueError):
+        masked_greedy_routes(3, 5, [[0, 1, 1], [1, 0, 1], [1, 1, 0]], [0, 6, 1])
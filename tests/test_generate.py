@@ -0,0 +1,27 @@
+import io
+
+import numpy as np
+
+from cvrp.cache import content_digest, open_binary, sidecar_path
+from cvrp.generate import generate_instance, write_instance, write_stream
+from cvrp.instance import load_instance
+
+OPTIONS = dict(seed=3, layout="clustered", metric="perturbed", distribution="bimodal")
+
+def test_file_stream_and_memory_agree(tmp_path):
+    n = 600     # Two full row blocks and a partial one
+    path = str(tmp_path / "gen.in")
+    Q = write_instance(path, n, binary=True, **OPTIONS)
+    out = io.BytesIO()
+    assert write_stream(out, n, **OPTIONS) == Q
+    with open(path, "rb") as f:
+        data = f.read()
+    assert out.getvalue() == data
+
+    expected = generate_instance(n, **OPTIONS)
+    parsed = load_instance(path, cache=False)
+    cached = open_binary(sidecar_path(path), content_digest(data))
+    for loaded in (parsed, cached):
+        assert loaded[:2] == (n, Q) == expected[:2]
+        assert np.array_equal(loaded[2], expected[2])
+        assert np.array_equal(loaded[3], expected[3])
@@ -0,0 +1,35 @@
+import random
+
+import numpy as np
+import pytest
+
+from cvrp.islands import solve_cvrp
+from cvrp.routes import check, total_distance
+
+def tiny_instance(n):
+    rng = random.Random(n)
+    points = [(rng.randint(0, 20), rng.randint(0, 20)) for _ in range(n)]
+    D = np.array([[round(((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5) for x2, y2 in points] for x1, y1 in points],
+                 dtype=np.int32)
+    q = [0] + [rng.randint(1, 5) for _ in range(n - 1)]
+    return n, 10, D, q
+
+@pytest.mark.parametrize("n", [2, 3, 6])
+@pytest.mark.parametrize("workers, islands", [(1, 2), (2, 2), (2, 1)])
+def test_tiny_instances(n, workers, islands):
+    # A handful of customers leaves fewer than two distinct individuals once clones are dropped
+    n, Q, D, q = tiny_instance(n)
+    random.seed(0)
+    routes = solve_cvrp(n, Q, D, q, workers=workers, islands=islands, epochs=2, iterations=20)
+    assert check(routes, n, Q, D, q)
+
+def test_workers_match_inline_run(read_lists):
+    n, Q, D, q = read_lists("1.in")
+    results = []
+    for workers in (1, 2):
+        random.seed(1)
+        routes = solve_cvrp(n, Q, np.array(D, dtype=np.int32), q, workers=workers, islands=2, epochs=2,
+                            iterations=50)
+        assert check(routes, n, Q, D, q)
+        results.append(total_distance(routes, D))
+    assert results[0] == results[1]
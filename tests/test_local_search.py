@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from cvrp.local_search import or_opt, three_opt, two_opt
+from cvrp.neighbors import neighbor_lists
+from cvrp.routes import calculate_route_distance
+
+def random_route(seed, n=14):
+    """A shuffled route over a symmetric integer distance matrix (the operators assume symmetry)."""
+    rng = random.Random(seed)
+    points = [(rng.randint(0, 100), rng.randint(0, 100)) for _ in range(n)]
+    D = [[round(((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5) for x2, y2 in points] for x1, y1 in points]
+    customers = list(range(1, n))
+    rng.shuffle(customers)
+    return [0] + customers + [0], D
+
+def assert_same_customers(route, original):
+    assert route[0] == route[-1] == 0
+    assert sorted(route[1:-1]) == sorted(original[1:-1])
+
+def best_two_opt_gain(route, D):
+    """Largest saving of any single 2-opt move, found by reversing every segment."""
+    cost = calculate_route_distance(route, D)
+    return max(cost - calculate_route_distance(route[:i] + route[i:j + 1][::-1] + route[j + 1:], D)
+               for i in range(1, len(route) - 1) for j in range(i + 1, len(route) - 1))
+
+def best_or_opt_gain(route, D, max_segment=3):
+    """Largest saving of moving any segment of up to max_segment customers elsewhere, either way round."""
+    cost = calculate_route_distance(route, D)
+    best = 0
+    for i in range(1, len(route) - 1):
+        for j in range(i, min(i + max_segment, len(route) - 1)):
+            segment, rest = route[i:j + 1], route[:i] + route[j + 1:]
+            for k in range(1, len(rest)):
+                for piece in (segment, segment[::-1]):
+                    best = max(best, cost - calculate_route_distance(rest[:k] + piece + rest[k:], D))
+    return best
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("mode", ["first", "best"])
+def test_two_opt_reaches_a_local_optimum(seed, mode):
+    route, D = random_route(seed)
+    original = list(route)
+    result = two_opt(route, D, mode=mode)
+    assert result is route
+    assert_same_customers(route, original)
+    assert calculate_route_distance(route, D) <= calculate_route_distance(original, D)
+    assert best_two_opt_gain(route, D) <= 0
+
+@pytest.mark.parametrize("seed", range(10))
+def test_two_opt_with_neighbors_keeps_the_route_valid(seed):
+    route, D = random_route(seed)
+    original = list(route)
+    two_opt(route, D, neighbors=neighbor_lists(D, 4))
+    assert_same_customers(route, original)
+    assert calculate_route_distance(route, D) <= calculate_route_distance(original, D)
+
+@pytest.mark.parametrize("seed", range(10))
+def test_or_opt_reaches_a_local_optimum(seed):
+    route, D = random_route(seed)
+    original = list(route)
+    or_opt(route, D)
+    assert_same_customers(route, original)
+    assert calculate_route_distance(route, D) <= calculate_route_distance(original, D)
+    assert best_or_opt_gain(route, D) <= 0
+
+@pytest.mark.parametrize("seed", range(10))
+def test_three_opt_is_optimal_for_both_moves(seed):
+    route, D = random_route(seed)
+    original = list(route)
+    three_opt(route, D)
+    assert_same_customers(route, original)
+    assert best_two_opt_gain(route, D) <= 0
+    assert best_or_opt_gain(route, D) <= 0
+
+def test_two_opt_rejects_unknown_mode():
+    route, D = random_route(0)
+    with pytest.raises(ValueError):
+        two_opt(route, D, mode="random")
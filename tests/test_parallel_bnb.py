@@ -0,0 +1,26 @@
+import os
+import signal
+
+import pytest
+
+from cvrp import parallel_bnb
+from cvrp.routes import check, total_distance
+
+def test_finds_the_optimum_on_1_in(read_lists):
+    n, Q, D, q = read_lists("1.in")
+    cost, routes, lower = parallel_bnb.parallel_depth_first(n, Q, D, q, workers=2)
+    assert cost == lower == total_distance(routes, D) == 804
+    assert check(routes, n, Q, D, q)
+
+def _crashing_worker(*args):
+    raise MemoryError("simulated")
+
+def _killed_worker(*args):
+    os.kill(os.getpid(), signal.SIGKILL)
+
+@pytest.mark.parametrize("worker", [_crashing_worker, _killed_worker])
+def test_dead_worker_is_reported(read_lists, monkeypatch, worker):
+    n, Q, D, q = read_lists("1.in")
+    monkeypatch.setattr(parallel_bnb, "_worker", worker)
+    with pytest.raises(RuntimeError, match="exited with code"):
+        parallel_bnb.parallel_depth_first(n, Q, D, q, workers=2)
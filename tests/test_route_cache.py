@@ -0,0 +1,55 @@
+from cvrp.subsets import COST_ENTRY, RouteCache, route_costs, subset_tour
+
+def masks_of(n, count):
+    return [1 << c | 1 << (c % (n - 1) + 1) for c in range(1, count + 1)]
+
+def test_route_counts_misses_then_hits(read_lists):
+    n, Q, D, q = read_lists("1.in")
+    cache = RouteCache(D)
+    mask = 1 << 3 | 1 << 6
+    assert cache.route(mask) == subset_tour(mask, D)
+    assert cache.route(mask) == subset_tour(mask, D)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert cache.cost(1 << 4) is None                   # Neither enumerated nor built
+    assert cache.cost(mask) == subset_tour(mask, D)[0]
+    assert (cache.hits, cache.misses) == (2, 2)
+
+def test_least_recently_used_routes_are_evicted(read_lists):
+    n, Q, D, q = read_lists("1.in")
+    first, second, third, fourth = masks_of(n, 4)     # Two-customer routes, all the same size
+    cache = RouteCache(D)
+    cache.route(first)
+    cache.max_bytes = 3 * cache.size
+    cache.route(second)
+    cache.route(third)
+    cache.route(first)      # Now the most recently used
+    cache.route(fourth)
+    assert list(cache.routes) == [third, first, fourth]
+    assert cache.evictions == 1 and cache.size <= cache.max_bytes
+    assert (cache.hits, cache.misses) == (1, 4)
+
+def test_enumeration_is_kept_and_reused(read_lists):
+    n, Q, D, q = read_lists("1.in")
+    cache = RouteCache(D)
+    costs, loads = route_costs(n, Q, D, q, cache=cache)
+    assert cache.costs is costs and cache.size == len(costs) * COST_ENTRY
+    again = route_costs(n, Q, D, q, cache=cache)
+    assert again[0] is costs and again[1] is loads
+    assert route_costs(n, Q, D, q, limit=10, cache=cache) is None
+    mask = next(iter(costs))
+    assert cache.cost(mask) == costs[mask] and cache.hits == 1
+
+def test_enumeration_that_does_not_fit_is_refused(read_lists):
+    n, Q, D, q = read_lists("1.in")
+    cache = RouteCache(D, max_bytes=100 * COST_ENTRY)
+    assert route_costs(n, Q, D, q, cache=cache) is None
+    assert cache.loads is None and not cache.costs
+
+def test_routes_give_way_to_costs(read_lists):
+    n, Q, D, q = read_lists("1.in")
+    cache = RouteCache(D, max_bytes=1298 * COST_ENTRY + 300)
+    for mask in masks_of(n, 4):
+        cache.route(mask)
+    route_costs(n, Q, D, q, cache=cache)
+    assert len(cache.costs) == 1298
+    assert cache.evictions > 0 and cache.size <= cache.max_bytes
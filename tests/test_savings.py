@@ -0,0 +1,61 @@
+import random
+
+import numpy as np
+import pytest
+
+from cvrp.instance import load_instance
+from cvrp.savings import merge_routes, savings_pairs, sparse_savings_pairs
+
+@pytest.mark.parametrize("name", ["1.in", "2.in"])
+def test_sparse_matches_dense_with_all_neighbours(instance_path, name):
+    n, Q, D, q = load_instance(instance_path(name), cache=False)
+    dense = savings_pairs(D)
+    for k in (n - 1, n + 5):
+        sparse = sparse_savings_pairs(D, k)
+        for a, b in zip(dense, sparse):
+            assert np.array_equal(a, b)
+
+def test_sparse_is_a_subset_of_dense(instance_path):
+    n, Q, D, q = load_instance(instance_path("2.in"), cache=False)
+    dense = set(zip(*[a.tolist() for a in savings_pairs(D)]))
+    sparse = list(zip(*[a.tolist() for a in sparse_savings_pairs(D, 5)]))
+    assert sparse and set(sparse) <= dense
+    assert [s for s, _, _ in sparse] == sorted((s for s, _, _ in sparse), reverse=True)
+
+def reference_merge(n, Q, q, pairs):
+    """Textbook Clarke-Wright on route lists: join two routes when i and j are ends of different routes."""
+    route_of = {c: [c] for c in range(1, n)}
+    for i, j in pairs:
+        a, b = route_of[i], route_of[j]
+        if a is b or sum(q[c] for c in a) + sum(q[c] for c in b) > Q:
+            continue
+        if i not in (a[0], a[-1]) or j not in (b[0], b[-1]):
+            continue
+        merged = (a if a[-1] == i else a[::-1]) + (b if b[0] == j else b[::-1])
+        for c in merged:
+            route_of[c] = merged
+    unique = {id(route): route for route in route_of.values()}
+    return list(unique.values())
+
+def undirected_edges(routes):
+    return {frozenset(edge) for route in routes for edge in zip(route, route[1:])}
+
+@pytest.mark.parametrize("seed", range(20))
+def test_merge_routes_matches_list_merge(seed):
+    rng = random.Random(seed)
+    n = rng.randint(3, 25)
+    q = [0] + [rng.randint(1, 10) for _ in range(n - 1)]
+    Q = rng.randint(10, 40)
+    pairs = [(i, j) for i in range(1, n) for j in range(i + 1, n)]
+    rng.shuffle(pairs)
+
+    routes = merge_routes(n, Q, q, pairs)
+    assert sorted(c for route in routes for c in route[1:-1]) == list(range(1, n))
+    assert all(route[0] == route[-1] == 0 and sum(q[c] for c in route) <= Q for route in routes)
+    expected = [[0] + route + [0] for route in reference_merge(n, Q, q, pairs)]
+    assert undirected_edges(routes) == undirected_edges(expected)
+
+def test_merge_routes_on_a_small_case():
+    # 1-2 merges first, then 3 joins at customer 2's end; 4 would overflow the vehicle
+    routes = merge_routes(5, 10, [0, 3, 3, 3, 3], [(1, 2), (2, 3), (1, 4), (3, 4)])
+    assert sorted(route[1:-1] if route[1] < route[-2] else route[-2:0:-1] for route in routes) == [[1, 2, 3], [4]]
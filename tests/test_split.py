@@ -0,0 +1,60 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from cvrp.routes import calculate_route_distance
+from cvrp.split import split
+
+def brute_split(tour, Q, D, q):
+    """Cheapest cutting of tour into capacity-feasible routes, trying every set of cut points."""
+    best = None
+    m = len(tour)
+    for cuts in itertools.product([False, True], repeat=m - 1):
+        routes, route = [], [tour[0]]
+        for c, cut in zip(tour[1:], cuts):
+            if cut:
+                routes.append(route)
+                route = []
+            route.append(c)
+        routes.append(route)
+        if any(sum(q[c] for c in route) > Q for route in routes):
+            continue
+        cost = sum(calculate_route_distance([0] + route + [0], D) for route in routes)
+        if best is None or cost < best:
+            best = cost
+    return best
+
+@pytest.mark.parametrize("seed", range(40))
+def test_split_matches_brute_force(seed):
+    rng = random.Random(seed)
+    n = rng.randint(2, 10)
+    points = [(rng.randint(0, 100), rng.randint(0, 100)) for _ in range(n)]
+    D = [[round(((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5) + (i != j) * rng.randint(0, 5)
+          for j, (x2, y2) in enumerate(points)] for i, (x1, y1) in enumerate(points)]
+    q = [0] + [rng.randint(1, 10) for _ in range(n - 1)]
+    Q = rng.randint(10, 30)
+    tour = list(range(1, n))
+    rng.shuffle(tour)
+
+    cost, routes = split(tour, Q, D, q)
+    assert cost == brute_split(tour, Q, D, q)
+    assert [c for route in routes for c in route[1:-1]] == tour
+    assert all(route[0] == route[-1] == 0 for route in routes)
+    assert all(sum(q[c] for c in route) <= Q for route in routes)
+    assert cost == sum(calculate_route_distance(route, D) for route in routes)
+
+def test_split_rejects_oversized_customer():
+    with pytest.raises(ValueError):
+        split([1, 2], 5, [[0, 1, 1], [1, 0, 1], [1, 1, 0]], [0, 6, 1])
+
+@pytest.mark.parametrize("seed", range(10))
+def test_split_on_an_ndarray_matches_lists(seed):
+    rng = random.Random(seed)
+    n = rng.randint(2, 30)
+    D = [[0 if i == j else rng.randint(1, 50) for j in range(n)] for i in range(n)]
+    q = [0] + [rng.randint(1, 10) for _ in range(n - 1)]
+    tour = list(range(1, n))
+    rng.shuffle(tour)
+    assert split(tour, 25, np.array(D, dtype=np.int32), q) == split(tour, 25, D, q)